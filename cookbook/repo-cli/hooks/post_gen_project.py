@@ -8,9 +8,17 @@ included so that non-GitHub users still have access to
 ``{{cookiecutter.target_repo}} template`` commands.
 """
 
-import shutil
+from pathlib import Path
 
 INCLUDE_WORKFLOWS = "{{ cookiecutter.include_github_workflows }}" == "yes"
 
-if not INCLUDE_WORKFLOWS:
-    shutil.rmtree(".github", ignore_errors=True)
+GITHUB_DIR = Path(".github")
+
+if not INCLUDE_WORKFLOWS and GITHUB_DIR.is_dir():
+    # Reverse-sorted so every file and subdirectory is removed before its parent.
+    for path in sorted(GITHUB_DIR.rglob("*"), reverse=True):
+        if path.is_dir():
+            path.rmdir()
+        else:
+            path.unlink()
+    GITHUB_DIR.rmdir()
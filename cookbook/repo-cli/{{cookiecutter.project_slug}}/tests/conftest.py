@@ -0,0 +1,24 @@
+"""Shared fixtures for {{cookiecutter.target_repo}} CLI tests."""
+
+from collections.abc import Callable
+
+import pytest
+from click.testing import CliRunner, Result
+
+from {{cookiecutter.package_name}}.tui.cli import cli
+
+
+@pytest.fixture(scope="session")
+def runner() -> CliRunner:
+    """Shared runner with color disabled so Rich and Click skip styling."""
+    return CliRunner(env={"NO_COLOR": "1", "TERM": "dumb"})
+
+
+@pytest.fixture(scope="session")
+def invoke(runner: CliRunner) -> Callable[[list[str]], Result]:
+    """Invoke the root ``cli`` group through the shared runner."""
+
+    def _invoke(args: list[str]) -> Result:
+        return runner.invoke(cli, args)
+
+    return _invoke
@@ -1,18 +1,35 @@
-from click.testing import CliRunner
+import re
+import subprocess
+import sys
+from collections.abc import Callable
 
-from {{cookiecutter.package_name}}.tui.cli import cli
+import pytest
+from click.testing import Result
 
+# Command names as they appear at the start of a ``Commands:`` listing row.
+_COMMAND_ROW_RE = re.compile(r"^\s+(dashboard|hello|help|status|template)\b", re.M)
 
-def test_hello_command() -> None:
-    runner = CliRunner()
-    result = runner.invoke(cli, ["hello"])
+
+@pytest.fixture(scope="module")
+def help_result(invoke: Callable[[list[str]], Result]) -> Result:
+    """``--help`` rendered once and shared by every help-text assertion."""
+    return invoke(["--help"])
+
+
+@pytest.fixture(scope="module")
+def empty_help_result(invoke: Callable[[list[str]], Result]) -> Result:
+    """Bare ``cli`` invocation (no args) rendered once per module."""
+    return invoke([])
+
+
+def test_hello_command(invoke: Callable[[list[str]], Result]) -> None:
+    result = invoke(["hello"])
     assert result.exit_code == 0
     assert "Hello from {{cookiecutter.package_name}}.tui" in result.output
 
 
-def test_no_args_shows_help() -> None:
-    runner = CliRunner()
-    result = runner.invoke(cli, [])
+def test_no_args_shows_help(empty_help_result: Result) -> None:
+    result = empty_help_result
     assert result.exit_code == 0
     assert "{{cookiecutter.project_name}}" in result.output
     assert "dashboard" in result.output
@@ -22,28 +39,39 @@ def test_no_args_shows_help() -> None:
     assert "template" in result.output
 
 
-def test_help_subcommand() -> None:
-    runner = CliRunner()
-    result = runner.invoke(cli, ["help"])
+def test_help_subcommand(invoke: Callable[[list[str]], Result]) -> None:
+    result = invoke(["help"])
     assert result.exit_code == 0
     assert "{{cookiecutter.project_name}}" in result.output
     assert "hello" in result.output
 
 
-def test_help_flag() -> None:
-    runner = CliRunner()
-    result = runner.invoke(cli, ["--help"])
-    assert result.exit_code == 0
-    assert "{{cookiecutter.project_name}}" in result.output
+def test_help_flag(help_result: Result) -> None:
+    assert help_result.exit_code == 0
+    assert "{{cookiecutter.project_name}}" in help_result.output
+
+
+def test_commands_listed_alphabetically(help_result: Result) -> None:
+    _, _, commands_section = help_result.output.partition("Commands:")
+    positions = {
+        m.group(1): m.start() for m in _COMMAND_ROW_RE.finditer(commands_section)
+    }
+    assert (
+        positions["dashboard"]
+        < positions["hello"]
+        < positions["help"]
+        < positions["status"]
+        < positions["template"]
+    )
 
 
-def test_commands_listed_alphabetically() -> None:
-    runner = CliRunner()
-    result = runner.invoke(cli, ["--help"])
-    commands_section = result.output[result.output.index("Commands:") :]
-    dashboard_pos = commands_section.index("dashboard")
-    hello_pos = commands_section.index("hello")
-    help_pos = commands_section.index("help", hello_pos + 1)
-    status_pos = commands_section.index("status")
-    template_pos = commands_section.index("template")
-    assert dashboard_pos < hello_pos < help_pos < status_pos < template_pos
+def test_cli_import_defers_rich_and_textual() -> None:
+    """Importing the root CLI must not load the rendering libraries."""
+    code = (
+        "import sys, {{cookiecutter.package_name}}.tui.cli; "
+        "print(sorted({'rich', 'textual'} & sys.modules.keys()))"
+    )
+    proc = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert proc.stdout.strip() == "[]"
@@ -1,9 +1,8 @@
 """Tests for the {{cookiecutter.target_repo}} dashboard subcommand."""
 
-import asyncio
-
 import click
 import pytest
+from textual.app import App
 from textual.widgets import Footer, Header, Static
 
 from {{cookiecutter.package_name}}.tui.cli import cli
@@ -17,6 +16,12 @@ from {{cookiecutter.package_name}}.tui.dashboard import (
     dashboard,
 )
 
+# Class-level facts about DashboardApp, computed once at collection.
+_IS_TEXTUAL_APP = issubclass(DashboardApp, App)
+_BINDING_KEYS = frozenset(
+    b[0] if isinstance(b, tuple) else b.key for b in DashboardApp.BINDINGS
+)
+
 
 class TestConstants:
     """Tests for the dashboard module constants."""
@@ -60,7 +65,10 @@ class TestCreateApp:
         assert app.sub_title == APP_SUBTITLE
 
     def test_custom_config(self) -> None:
-        config = DashboardConfig(title="Custom", subtitle="v2.0", message="Hi")
+        # Trusted input for create_app; validation is covered by the model tests.
+        config = DashboardConfig.model_construct(
+            title="Custom", subtitle="v2.0", message="Hi"
+        )
         app = create_app(config=config)
         assert app.title == "Custom"
         assert app.sub_title == "v2.0"
@@ -70,27 +78,19 @@ class TestDashboardApp:
     """Tests for the DashboardApp Textual application."""
 
     def test_app_is_textual_app(self) -> None:
-        from textual.app import App
-
-        assert issubclass(DashboardApp, App)
+        assert _IS_TEXTUAL_APP
 
     def test_app_has_quit_binding(self) -> None:
-        bindings = DashboardApp.BINDINGS
-        keys = [b[0] if isinstance(b, tuple) else b.key for b in bindings]
-        assert "q" in keys
-
-    def test_app_composes_widgets(self) -> None:
-        """Verify compose yields Header, Static, and Footer."""
-
-        async def _check() -> None:
-            app = create_app()
-            async with app.run_test():
-                app.query_one(Header)
-                app.query_one(Footer)
-                welcome = app.query_one("#welcome", Static)
-                assert WELCOME_MESSAGE in welcome.content
-
-        asyncio.run(_check())
+        assert "q" in _BINDING_KEYS
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_app_composes_widgets(self) -> None:
+        """Verify compose yields Header, Static, and Footer in a single mount."""
+        async with create_app().run_test() as pilot:
+            pilot.app.query_one(Header)
+            pilot.app.query_one(Footer)
+            welcome = pilot.app.query_one("#welcome", Static)
+            assert WELCOME_MESSAGE in welcome.content
 
 
 class TestDashboardCommand:
@@ -1,10 +1,11 @@
 """Tests for the {{cookiecutter.target_repo}} status subcommand."""
 
+from collections.abc import Callable
 from io import StringIO
 
 import click
 import pytest
-from click.testing import CliRunner
+from click.testing import Result
 from rich.console import Console
 
 from {{cookiecutter.package_name}}.tui.cli import cli
@@ -64,75 +65,84 @@ class TestStatusReportModel:
         assert report.items == []
 
 
+def _captured_console() -> tuple[Console, StringIO]:
+    """Return a Rich console writing into a fresh buffer.
+
+    Width and color system are pinned so Rich skips terminal detection.
+    """
+    buf = StringIO()
+    console = Console(file=buf, force_terminal=True, width=80, color_system=None)
+    return console, buf
+
+
+@pytest.fixture(scope="module")
+def status_report() -> StatusReport:
+    """A single ``get_status()`` result shared across the module."""
+    return get_status()
+
+
+@pytest.fixture(scope="module")
+def rendered_status(status_report: StatusReport) -> str:
+    """``status_report`` rendered once through a captured Rich console."""
+    console, buf = _captured_console()
+    render_status(status_report, console=console)
+    return buf.getvalue()
+
+
 class TestGetStatus:
     """Tests for the get_status function."""
 
-    def test_returns_status_report(self) -> None:
-        result = get_status()
-        assert isinstance(result, StatusReport)
+    def test_returns_status_report(self, status_report: StatusReport) -> None:
+        assert isinstance(status_report, StatusReport)
 
-    def test_report_project_matches_constant(self) -> None:
-        result = get_status()
-        assert result.project == PROJECT_NAME
+    def test_report_project_matches_constant(self, status_report: StatusReport) -> None:
+        assert status_report.project == PROJECT_NAME
 
-    def test_report_version_matches_constant(self) -> None:
-        result = get_status()
-        assert result.version == VERSION
+    def test_report_version_matches_constant(self, status_report: StatusReport) -> None:
+        assert status_report.version == VERSION
 
-    def test_report_has_items(self) -> None:
-        result = get_status()
-        assert len(result.items) > 0
+    def test_report_has_items(self, status_report: StatusReport) -> None:
+        assert len(status_report.items) > 0
 
-    def test_report_items_are_status_items(self) -> None:
-        result = get_status()
-        for item in result.items:
+    def test_report_items_are_status_items(self, status_report: StatusReport) -> None:
+        for item in status_report.items:
             assert isinstance(item, StatusItem)
 
 
 class TestRenderStatus:
     """Tests for the render_status function."""
 
-    def test_render_produces_output(self) -> None:
-        report = get_status()
-        buf = StringIO()
-        console = Console(file=buf, force_terminal=True)
-        render_status(report, console=console)
-        output = buf.getvalue()
-        assert len(output) > 0
-
-    def test_render_contains_project_name(self) -> None:
-        report = get_status()
-        buf = StringIO()
-        console = Console(file=buf, force_terminal=True)
-        render_status(report, console=console)
-        output = buf.getvalue()
-        assert PROJECT_NAME in output
-
-    def test_render_returns_console(self) -> None:
-        report = get_status()
-        buf = StringIO()
-        console = Console(file=buf, force_terminal=True)
-        result = render_status(report, console=console)
+    def test_render_output(self, rendered_status: str) -> None:
+        """The render is non-empty and names the project."""
+        assert len(rendered_status) > 0
+        assert PROJECT_NAME in rendered_status
+
+    def test_render_returns_console(self, status_report: StatusReport) -> None:
+        console, _ = _captured_console()
+        result = render_status(status_report, console=console)
         assert result is console
 
-    def test_render_creates_console_when_none(self) -> None:
-        report = get_status()
-        result = render_status(report)
+    def test_render_creates_console_when_none(
+        self, status_report: StatusReport
+    ) -> None:
+        result = render_status(status_report)
         assert isinstance(result, Console)
 
 
+@pytest.fixture(scope="module")
+def status_invocation(invoke: Callable[[list[str]], Result]) -> Result:
+    """``status`` invoked once and shared by the CLI output tests."""
+    return invoke(["status"])
+
+
 class TestStatusCLI:
     """Tests for the {{cookiecutter.target_repo}} status CLI command."""
 
-    def test_status_exits_zero(self) -> None:
-        runner = CliRunner()
-        result = runner.invoke(cli, ["status"])
-        assert result.exit_code == 0
+    def test_status_exits_zero(self, status_invocation: Result) -> None:
+        assert status_invocation.exit_code == 0
 
-    def test_status_produces_output(self) -> None:
-        runner = CliRunner()
-        result = runner.invoke(cli, ["status"])
-        assert len(result.output) > 0
+    def test_status_produces_output(self, status_invocation: Result) -> None:
+        assert len(status_invocation.output) > 0
 
 
 class TestStatusModuleStructure:
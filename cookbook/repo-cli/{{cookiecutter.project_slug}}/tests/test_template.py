@@ -1,8 +1,13 @@
 """Tests for the {{cookiecutter.target_repo}} template subcommand."""
 
+import contextlib
+from collections.abc import Callable
+from io import StringIO
+from types import CodeType
+
 import click
 import pytest
-from click.testing import CliRunner
+from click.testing import Result
 
 from {{cookiecutter.package_name}}.tui.cli import cli
 from {{cookiecutter.package_name}}.tui.template import (
@@ -15,6 +20,14 @@ from {{cookiecutter.package_name}}.tui.template import (
     template,
 )
 
+_COG_MARKERS = (COG_OPEN, COG_CLOSE, COG_END)
+
+
+@pytest.fixture(scope="module")
+def template_code_obj() -> CodeType:
+    """``TEMPLATE_CODE`` compiled once and shared by the execution tests."""
+    return compile(TEMPLATE_CODE, "<template>", "exec")
+
 
 class TestTemplateCode:
     """Tests for the template code constant."""
@@ -22,24 +35,19 @@ class TestTemplateCode:
     def test_template_code_is_nonempty(self) -> None:
         assert len(TEMPLATE_CODE) > 0
 
-    def test_template_code_is_valid_python(self) -> None:
+    def test_template_code_is_valid_python(self, template_code_obj: CodeType) -> None:
         """The stub template code must be executable Python."""
-        compile(TEMPLATE_CODE, "<template>", "exec")
+        assert isinstance(template_code_obj, CodeType)
 
-    def test_template_code_is_noop(self) -> None:
+    def test_template_code_is_noop(self, template_code_obj: CodeType) -> None:
         """The stub template should produce no output when executed."""
-        from io import StringIO
-        import contextlib
-
         f = StringIO()
         with contextlib.redirect_stdout(f):
-            exec(TEMPLATE_CODE)  # noqa: S102
+            exec(template_code_obj, {})  # noqa: S102
         assert f.getvalue() == ""
 
     def test_template_code_does_not_contain_cog_markers(self) -> None:
-        assert "<!--[[[cog" not in TEMPLATE_CODE
-        assert "]]]-->" not in TEMPLATE_CODE
-        assert "<!--[[[end]]]-->" not in TEMPLATE_CODE
+        assert not any(marker in TEMPLATE_CODE for marker in _COG_MARKERS)
 
 
 class TestTemplateOutputModel:
@@ -83,28 +91,32 @@ class TestCogMarkers:
         assert COG_END == "<!--[[[end]]]-->"
 
 
+@pytest.fixture(scope="module")
+def template_invocation(invoke: Callable[[list[str]], Result]) -> Result:
+    """``template`` invoked once and shared by the CLI output tests."""
+    return invoke(["template"])
+
+
 class TestTemplateCLI:
     """Tests for the {{cookiecutter.target_repo}} template CLI command."""
 
-    def test_template_outputs_code(self) -> None:
-        runner = CliRunner()
-        result = runner.invoke(cli, ["template"])
-        assert result.exit_code == 0
-        assert TEMPLATE_CODE in result.output
-
-    def test_template_output_does_not_contain_cog_markers(self) -> None:
-        runner = CliRunner()
-        result = runner.invoke(cli, ["template"])
-        assert result.exit_code == 0
-        assert "<!--[[[cog" not in result.output
-        assert "<!--[[[end]]]-->" not in result.output
-
-    def test_template_output_matches_constant(self) -> None:
-        runner = CliRunner()
-        result = runner.invoke(cli, ["template"])
-        assert result.exit_code == 0
+    def test_template_outputs_code(self, template_invocation: Result) -> None:
+        assert template_invocation.exit_code == 0
+        assert TEMPLATE_CODE in template_invocation.output
+
+    def test_template_output_does_not_contain_cog_markers(
+        self, template_invocation: Result
+    ) -> None:
+        assert template_invocation.exit_code == 0
+        output = template_invocation.output
+        assert not any(marker in output for marker in _COG_MARKERS)
+
+    def test_template_output_matches_constant(
+        self, template_invocation: Result
+    ) -> None:
+        assert template_invocation.exit_code == 0
         # Output has trailing newline from click.echo
-        assert result.output.strip() == TEMPLATE_CODE
+        assert template_invocation.output.strip() == TEMPLATE_CODE
 
 
 class TestTemplateModuleStructure:
@@ -1,15 +1,18 @@
 """Tests for the {{cookiecutter.target_repo}} template apply subcommand."""
 
+import os
+from collections.abc import Callable
 from pathlib import Path
 
 import pytest
-from click.testing import CliRunner
+from click.testing import Result
+from pyfakefs.fake_filesystem import FakeFilesystem
 
-from {{cookiecutter.package_name}}.tui.cli import cli
 from {{cookiecutter.package_name}}.tui.template import (
     TEMPLATE_CODE,
     ApplyResult,
     apply_template,
+    apply_template_str,
     wrap_with_cog,
 )
 
@@ -70,101 +73,145 @@ class TestApplyResultModel:
             ApplyResult()  # type: ignore[call-arg]
 
 
-class TestApplyTemplate:
-    """Tests for the apply_template function."""
+_HEADER = "# My Repo\n\nSome intro text.\n\n"
+_FOOTER = "\n\n## Footer section\n\nMore text.\n"
 
-    def test_replaces_placeholder_in_readme(self, tmp_path: Path) -> None:
-        readme = tmp_path / "README.md"
-        readme.write_text("# Title\n\n<template placeholder>\n\n## Footer\n")
-        result = apply_template(readme)
-        assert result.placeholder_found is True
-        assert result.content_written is True
-        content = readme.read_text()
+AppliedReadme = tuple[Path, str, ApplyResult]
+
+
+@pytest.fixture(scope="module")
+def applied_readme(tmp_path_factory: pytest.TempPathFactory) -> AppliedReadme:
+    """Write a README around the placeholder, apply once, and read it back.
+
+    Returns ``(readme, content, result)`` so each test asserts a distinct
+    property of the same applied file.
+    """
+    readme = tmp_path_factory.mktemp("applied") / "README.md"
+    readme.write_text(_HEADER + "<template placeholder>" + _FOOTER)
+    result = apply_template(readme)
+    return readme, readme.read_text(), result
+
+
+class TestApplyTemplateStr:
+    """Tests for the in-memory apply_template_str core."""
+
+    def test_replaces_placeholder(self) -> None:
+        content, found = apply_template_str(
+            "# Title\n\n<template placeholder>\n\n## Footer\n"
+        )
+        assert found is True
         assert "<!--[[[cog" in content
         assert "<!--[[[end]]]-->" in content
         assert TEMPLATE_CODE in content
         assert "<template placeholder>" not in content
 
-    def test_replaces_last_occurrence(self, tmp_path: Path) -> None:
-        readme = tmp_path / "README.md"
-        readme.write_text(
-            "First: <template placeholder>\n\n"
-            "Second: <template placeholder>\n"
+    def test_replaces_last_occurrence(self) -> None:
+        content, found = apply_template_str(
+            "First: <template placeholder>\n\nSecond: <template placeholder>\n"
         )
-        result = apply_template(readme)
-        assert result.placeholder_found is True
-        content = readme.read_text()
+        assert found is True
         # The first occurrence should remain
         assert content.startswith("First: <template placeholder>")
         # The second should be replaced
         assert "Second: <!--[[[cog" in content
 
-    def test_error_when_no_placeholder(self, tmp_path: Path) -> None:
-        readme = tmp_path / "README.md"
-        readme.write_text("# Title\n\nNo placeholder here\n")
+    def test_returns_content_unchanged_when_no_placeholder(self) -> None:
+        original = "# Title\n\nNo placeholder here\n"
+        content, found = apply_template_str(original)
+        assert found is False
+        assert content == original
+
+    def test_preserves_surrounding_content(self) -> None:
+        content, _ = apply_template_str(_HEADER + "<template placeholder>" + _FOOTER)
+        assert content.startswith(_HEADER)
+        assert content.endswith(_FOOTER)
+
+    def test_applied_cog_block_is_noop(self) -> None:
+        """After applying, the Cog block should contain the stub template code."""
+        content, _ = apply_template_str("# Title\n\n<template placeholder>\n")
+        assert f"<!--[[[cog\n{TEMPLATE_CODE}\n]]]-->" in content
+
+
+class TestApplyTemplate:
+    """Tests for the file-backed apply_template wrapper."""
+
+    def test_writes_applied_content(self, applied_readme: AppliedReadme) -> None:
+        _, content, result = applied_readme
+        expected, _ = apply_template_str(_HEADER + "<template placeholder>" + _FOOTER)
+        assert result.placeholder_found is True
+        assert result.content_written is True
+        assert content == expected
+
+    def test_error_when_no_placeholder(self, fs: FakeFilesystem) -> None:
+        readme = Path("/repo/README.md")
+        fs.create_file(readme, contents="# Title\n\nNo placeholder here\n")
         result = apply_template(readme)
         assert result.placeholder_found is False
         assert result.content_written is False
+        assert readme.read_text() == "# Title\n\nNo placeholder here\n"
 
-    def test_preserves_surrounding_content(self, tmp_path: Path) -> None:
-        readme = tmp_path / "README.md"
-        header = "# My Repo\n\nSome intro text.\n\n"
-        footer = "\n\n## Footer section\n\nMore text.\n"
-        readme.write_text(header + "<template placeholder>" + footer)
-        apply_template(readme)
-        content = readme.read_text()
-        assert content.startswith(header)
-        assert content.endswith(footer)
-
-    def test_apply_result_contains_path(self, tmp_path: Path) -> None:
-        readme = tmp_path / "README.md"
-        readme.write_text("<template placeholder>\n")
-        result = apply_template(readme)
+    def test_apply_result_contains_path(self, applied_readme: AppliedReadme) -> None:
+        readme, _, result = applied_readme
         assert result.readme_path == str(readme)
 
-    def test_applied_cog_block_is_noop(self, tmp_path: Path) -> None:
-        """After applying, the Cog block should contain the stub template code."""
-        readme = tmp_path / "README.md"
-        readme.write_text("# Title\n\n<template placeholder>\n")
+    def test_replaces_file_atomically(self, fs: FakeFilesystem) -> None:
+        readme = Path("/repo/README.md")
+        fs.create_file(readme, contents="<template placeholder>\n", st_mode=0o100640)
         apply_template(readme)
-        content = readme.read_text()
-        assert f"<!--[[[cog\n{TEMPLATE_CODE}\n]]]-->" in content
+        assert readme.stat().st_mode & 0o777 == 0o640
+        assert os.listdir("/repo") == ["README.md"]
+
+    def test_writes_through_symlinked_readme(self, fs: FakeFilesystem) -> None:
+        target = Path("/docs/README.md")
+        fs.create_file(target, contents="<template placeholder>\n")
+        readme = Path("/repo/README.md")
+        fs.create_symlink(readme, target)
+        apply_template(readme)
+        assert readme.is_symlink()
+        assert TEMPLATE_CODE in target.read_text()
 
 
 class TestApplyCLI:
     """Tests for the {{cookiecutter.target_repo}} template apply CLI command."""
 
-    def test_apply_replaces_placeholder(self, tmp_path: Path) -> None:
-        readme = tmp_path / "README.md"
-        readme.write_text("# Title\n\n<template placeholder>\n\n## Footer\n")
-        runner = CliRunner()
-        result = runner.invoke(cli, ["template", "apply", "--readme", str(readme)])
+    def test_apply_replaces_placeholder(
+        self, fs: FakeFilesystem, invoke: Callable[[list[str]], Result]
+    ) -> None:
+        readme = Path("/repo/README.md")
+        fs.create_file(
+            readme, contents="# Title\n\n<template placeholder>\n\n## Footer\n"
+        )
+        result = invoke(["template", "apply", "--readme", str(readme)])
         assert result.exit_code == 0
         content = readme.read_text()
         assert "<!--[[[cog" in content
         assert TEMPLATE_CODE in content
         assert "<template placeholder>" not in content
 
-    def test_apply_reports_missing_placeholder(self, tmp_path: Path) -> None:
-        readme = tmp_path / "README.md"
-        readme.write_text("# Title\n\nNo placeholder\n")
-        runner = CliRunner()
-        result = runner.invoke(cli, ["template", "apply", "--readme", str(readme)])
+    def test_apply_reports_missing_placeholder(
+        self, fs: FakeFilesystem, invoke: Callable[[list[str]], Result]
+    ) -> None:
+        readme = Path("/repo/README.md")
+        fs.create_file(readme, contents="# Title\n\nNo placeholder\n")
+        result = invoke(["template", "apply", "--readme", str(readme)])
         assert result.exit_code != 0
 
-    def test_apply_default_readme_path(self) -> None:
+    def test_apply_default_readme_path(
+        self, fs: FakeFilesystem, invoke: Callable[[list[str]], Result]
+    ) -> None:
         """Test that --readme defaults to README.md in current directory."""
-        runner = CliRunner()
-        with runner.isolated_filesystem():
-            Path("README.md").write_text("<template placeholder>\n")
-            result = runner.invoke(cli, ["template", "apply"])
-            assert result.exit_code == 0
-            content = Path("README.md").read_text()
-            assert "<!--[[[cog" in content
-
-    def test_apply_reports_missing_readme(self) -> None:
-        runner = CliRunner()
-        with runner.isolated_filesystem():
-            result = runner.invoke(cli, ["template", "apply"])
-            assert result.exit_code != 0
-            assert "README not found" in result.output
+        fs.create_file("/repo/README.md", contents="<template placeholder>\n")
+        os.chdir("/repo")
+        result = invoke(["template", "apply"])
+        assert result.exit_code == 0
+        content = Path("README.md").read_text()
+        assert "<!--[[[cog" in content
+
+    def test_apply_reports_missing_readme(
+        self, fs: FakeFilesystem, invoke: Callable[[list[str]], Result]
+    ) -> None:
+        fs.create_dir("/repo")
+        os.chdir("/repo")
+        result = invoke(["template", "apply"])
+        assert result.exit_code != 0
+        assert "README not found" in result.output
@@ -1,11 +1,11 @@
 """Tests for the {{cookiecutter.target_repo}} template prepare subcommand."""
 
+from collections.abc import Callable
 from pathlib import Path
 
 import pytest
-from click.testing import CliRunner
+from click.testing import Result
 
-from {{cookiecutter.package_name}}.tui.cli import cli
 from {{cookiecutter.package_name}}.tui.template import (
     COG_CLOSE,
     COG_END,
@@ -37,18 +37,35 @@ class TestPrepareResultModel:
             PrepareResult()  # type: ignore[call-arg]
 
 
+_HEADER = "# My Repo\n\nSome intro text.\n\n"
+_FOOTER = "\n\n## Footer section\n\nMore text.\n"
+
+PreparedReadme = tuple[Path, str, PrepareResult]
+
+
+@pytest.fixture(scope="module")
+def prepared_readme(tmp_path_factory: pytest.TempPathFactory) -> PreparedReadme:
+    """Write a README around a no-op Cog block, prepare once, and read it back.
+
+    Returns ``(readme, content, result)`` so each test asserts a distinct
+    property of the same prepared file.
+    """
+    readme = tmp_path_factory.mktemp("prepared") / "README.md"
+    readme.write_text(_HEADER + wrap_with_cog(TEMPLATE_CODE) + _FOOTER)
+    result = prepare_template(readme)
+    return readme, readme.read_text(), result
+
+
 class TestPrepareTemplate:
     """Tests for the prepare_template function."""
 
-    def test_replaces_cog_block_without_output(self, tmp_path: Path) -> None:
+    def test_replaces_cog_block_without_output(
+        self, prepared_readme: PreparedReadme
+    ) -> None:
         """A Cog block with no cached output is replaced with the placeholder."""
-        readme = tmp_path / "README.md"
-        wrapped = wrap_with_cog(TEMPLATE_CODE)
-        readme.write_text(f"# Title\n\n{wrapped}\n\n## Footer\n")
-        result = prepare_template(readme)
+        _, content, result = prepared_readme
         assert result.cog_block_found is True
         assert result.placeholder_written is True
-        content = readme.read_text()
         assert PLACEHOLDER in content
         assert COG_OPEN not in content
         assert COG_END not in content
@@ -85,28 +102,46 @@ class TestPrepareTemplate:
         # The second should be replaced with placeholder
         assert f"Second: {PLACEHOLDER}" in content
 
-    def test_error_when_no_cog_block(self, tmp_path: Path) -> None:
+    def test_unterminated_trailing_cog_open_is_not_a_block(
+        self, tmp_path: Path
+    ) -> None:
+        """A trailing opening marker with no end marker leaves the README alone."""
         readme = tmp_path / "README.md"
-        readme.write_text("# Title\n\nNo cog block here\n")
+        wrapped = wrap_with_cog(TEMPLATE_CODE)
+        original = f"{wrapped}\n\nStray: {COG_OPEN}\n"
+        readme.write_text(original)
         result = prepare_template(readme)
         assert result.cog_block_found is False
         assert result.placeholder_written is False
+        assert readme.read_text() == original
 
-    def test_preserves_surrounding_content(self, tmp_path: Path) -> None:
+    def test_stray_cog_open_before_block_is_preserved(self, tmp_path: Path) -> None:
+        """Prose mentioning the opener above the real block survives intact."""
         readme = tmp_path / "README.md"
-        header = "# My Repo\n\nSome intro text.\n\n"
-        footer = "\n\n## Footer section\n\nMore text.\n"
-        wrapped = wrap_with_cog(TEMPLATE_CODE)
-        readme.write_text(header + wrapped + footer)
-        prepare_template(readme)
-        content = readme.read_text()
-        assert content.startswith(header)
-        assert content.endswith(footer)
+        prose = f"Cog blocks start with `{COG_OPEN}`.\n\n## Important section\n\n"
+        readme.write_text(f"{prose}{wrap_with_cog(TEMPLATE_CODE)}\n")
+        result = prepare_template(readme)
+        assert result.cog_block_found is True
+        assert readme.read_text() == f"{prose}{PLACEHOLDER}\n"
 
-    def test_prepare_result_contains_path(self, tmp_path: Path) -> None:
+    def test_error_when_no_cog_block(self, tmp_path: Path) -> None:
         readme = tmp_path / "README.md"
-        readme.write_text(wrap_with_cog(TEMPLATE_CODE))
+        readme.write_text("# Title\n\nNo cog block here\n")
         result = prepare_template(readme)
+        assert result.cog_block_found is False
+        assert result.placeholder_written is False
+
+    def test_preserves_surrounding_content(
+        self, prepared_readme: PreparedReadme
+    ) -> None:
+        _, content, _ = prepared_readme
+        assert content.startswith(_HEADER)
+        assert content.endswith(_FOOTER)
+
+    def test_prepare_result_contains_path(
+        self, prepared_readme: PreparedReadme
+    ) -> None:
+        readme, _, result = prepared_readme
         assert result.readme_path == str(readme)
 
     def test_prepared_noop_block_restores_placeholder(self, tmp_path: Path) -> None:
@@ -185,46 +220,54 @@ class TestPrepareIdempotence:
 class TestPrepareCLI:
     """Tests for the {{cookiecutter.target_repo}} template prepare CLI command."""
 
-    def test_prepare_replaces_cog_block(self, tmp_path: Path) -> None:
+    def test_prepare_replaces_cog_block(
+        self, tmp_path: Path, invoke: Callable[[list[str]], Result]
+    ) -> None:
         readme = tmp_path / "README.md"
         wrapped = wrap_with_cog(TEMPLATE_CODE)
         readme.write_text(f"# Title\n\n{wrapped}\n\n## Footer\n")
-        runner = CliRunner()
-        result = runner.invoke(
-            cli, ["template", "prepare", "--readme", str(readme)]
-        )
+        result = invoke(["template", "prepare", "--readme", str(readme)])
         assert result.exit_code == 0
         content = readme.read_text()
         assert PLACEHOLDER in content
         assert COG_OPEN not in content
 
-    def test_prepare_reports_missing_cog_block(self, tmp_path: Path) -> None:
+    def test_prepare_reports_missing_cog_block(
+        self, tmp_path: Path, invoke: Callable[[list[str]], Result]
+    ) -> None:
         readme = tmp_path / "README.md"
         readme.write_text("# Title\n\nNo cog block\n")
-        runner = CliRunner()
-        result = runner.invoke(
-            cli, ["template", "prepare", "--readme", str(readme)]
-        )
+        result = invoke(["template", "prepare", "--readme", str(readme)])
         assert result.exit_code != 0
 
-    def test_prepare_default_readme_path(self) -> None:
+    def test_prepare_default_readme_path(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        invoke: Callable[[list[str]], Result],
+    ) -> None:
         """Test that --readme defaults to README.md in current directory."""
-        runner = CliRunner()
-        with runner.isolated_filesystem():
-            Path("README.md").write_text(wrap_with_cog(TEMPLATE_CODE) + "\n")
-            result = runner.invoke(cli, ["template", "prepare"])
-            assert result.exit_code == 0
-            content = Path("README.md").read_text()
-            assert PLACEHOLDER in content
-
-    def test_prepare_reports_missing_readme(self) -> None:
-        runner = CliRunner()
-        with runner.isolated_filesystem():
-            result = runner.invoke(cli, ["template", "prepare"])
-            assert result.exit_code != 0
-            assert "README not found" in result.output
-
-    def test_prepare_with_cached_output_via_cli(self, tmp_path: Path) -> None:
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "README.md").write_text(wrap_with_cog(TEMPLATE_CODE) + "\n")
+        result = invoke(["template", "prepare"])
+        assert result.exit_code == 0
+        content = (tmp_path / "README.md").read_text()
+        assert PLACEHOLDER in content
+
+    def test_prepare_reports_missing_readme(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        invoke: Callable[[list[str]], Result],
+    ) -> None:
+        monkeypatch.chdir(tmp_path)
+        result = invoke(["template", "prepare"])
+        assert result.exit_code != 0
+        assert "README not found" in result.output
+
+    def test_prepare_with_cached_output_via_cli(
+        self, tmp_path: Path, invoke: Callable[[list[str]], Result]
+    ) -> None:
         """CLI handles Cog blocks that include cached output."""
         readme = tmp_path / "README.md"
         cog_block = (
@@ -233,10 +276,7 @@ class TestPrepareCLI:
             f"{COG_END}"
         )
         readme.write_text(cog_block)
-        runner = CliRunner()
-        result = runner.invoke(
-            cli, ["template", "prepare", "--readme", str(readme)]
-        )
+        result = invoke(["template", "prepare", "--readme", str(readme)])
         assert result.exit_code == 0
         content = readme.read_text()
         assert PLACEHOLDER in content
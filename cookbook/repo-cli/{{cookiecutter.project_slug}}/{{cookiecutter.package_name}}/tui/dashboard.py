@@ -1,15 +1,21 @@
 """Textual TUI dashboard for {{cookiecutter.project_name}}.
 
-This module provides a minimal Textual application and the Click command
+This module provides the dashboard configuration and the Click command
 that ``{{cookiecutter.package_name}}.tui.cli`` registers onto the root CLI.
+The Textual application class lives in
+``{{cookiecutter.package_name}}.tui.dashboard_app`` and is imported on first
+use, so CLI startup does not pay for Textual.
 """
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING, Any
+
 import click
 from pydantic import BaseModel
-from textual.app import App, ComposeResult
-from textual.widgets import Footer, Header, Static
+
+if TYPE_CHECKING:
+    from {{cookiecutter.package_name}}.tui.dashboard_app import DashboardApp
 
 APP_TITLE: str = "{{cookiecutter.project_name}}"
 APP_SUBTITLE: str = "v0.1.0"
@@ -24,27 +30,20 @@ class DashboardConfig(BaseModel):
     message: str = WELCOME_MESSAGE
 
 
-class DashboardApp(App[None]):
-    """A minimal Textual application for {{cookiecutter.project_name}}."""
-
-    BINDINGS = [("q", "quit", "Quit")]
+def create_app(config: DashboardConfig | None = None) -> DashboardApp:
+    """Create and return a configured DashboardApp instance."""
+    from {{cookiecutter.package_name}}.tui.dashboard_app import DashboardApp  # noqa: PLC0415
 
-    def __init__(self, config: DashboardConfig | None = None) -> None:
-        self._config = config or DashboardConfig()
-        super().__init__()
-        self.title = self._config.title
-        self.sub_title = self._config.subtitle
+    return DashboardApp(config=config)
 
-    def compose(self) -> ComposeResult:
-        """Compose the application layout."""
-        yield Header()
-        yield Static(self._config.message, id="welcome")
-        yield Footer()
 
+def __getattr__(name: str) -> Any:
+    """Resolve ``DashboardApp`` lazily so importing this module skips Textual."""
+    if name == "DashboardApp":
+        from {{cookiecutter.package_name}}.tui.dashboard_app import DashboardApp  # noqa: PLC0415
 
-def create_app(config: DashboardConfig | None = None) -> DashboardApp:
-    """Create and return a configured DashboardApp instance."""
-    return DashboardApp(config=config)
+        return DashboardApp
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # ---------------------------------------------------------------------------
@@ -0,0 +1,31 @@
+"""Textual application class for the {{cookiecutter.project_name}} dashboard.
+
+Kept apart from ``{{cookiecutter.package_name}}.tui.dashboard`` so that
+registering the ``dashboard`` command on the root CLI does not import Textual;
+this module is only loaded when the app is actually created.
+"""
+
+from __future__ import annotations
+
+from textual.app import App, ComposeResult
+from textual.widgets import Footer, Header, Static
+
+from {{cookiecutter.package_name}}.tui.dashboard import DashboardConfig
+
+
+class DashboardApp(App[None]):
+    """A minimal Textual application for {{cookiecutter.project_name}}."""
+
+    BINDINGS = [("q", "quit", "Quit")]
+
+    def __init__(self, config: DashboardConfig | None = None) -> None:
+        self._config = config or DashboardConfig()
+        super().__init__()
+        self.title = self._config.title
+        self.sub_title = self._config.subtitle
+
+    def compose(self) -> ComposeResult:
+        """Compose the application layout."""
+        yield Header()
+        yield Static(self._config.message, id="welcome")
+        yield Footer()
@@ -8,10 +8,13 @@ models, business logic, and Click command that
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 import click
 from pydantic import BaseModel
-from rich.console import Console
-from rich.table import Table
+
+if TYPE_CHECKING:
+    from rich.console import Console
 
 PROJECT_NAME: str = "{{cookiecutter.project_name}}"
 VERSION: str = "0.1.0"
@@ -49,7 +52,11 @@ def render_status(report: StatusReport, console: Console | None = None) -> Conso
     """Render a StatusReport as a Rich table.
 
     Returns the Console instance used (useful for testing with captured output).
+    Rich is imported here rather than at module load to keep CLI startup fast.
     """
+    from rich.console import Console  # noqa: PLC0415
+    from rich.table import Table  # noqa: PLC0415
+
     if console is None:
         console = Console()
     table = Table(title=f"{report.project} Status")
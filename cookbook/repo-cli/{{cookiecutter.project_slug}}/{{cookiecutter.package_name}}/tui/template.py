@@ -5,6 +5,9 @@ subcommand.  It owns both the business logic (constants, models, helpers) and
 the Click command group that ``{{cookiecutter.package_name}}.tui.cli`` registers onto the root CLI.
 """
 
+import os
+import shutil
+import tempfile
 from pathlib import Path
 
 import click
@@ -16,6 +19,12 @@ COG_CLOSE: str = "]]]-->"
 COG_END: str = "<!--[[[end]]]-->"
 
 PLACEHOLDER: str = "<template placeholder>"
+_PLACEHOLDER_BYTES: bytes = PLACEHOLDER.encode()
+
+# Byte forms of the delimiters ``prepare`` searches for, so it never decodes
+# the README.
+_COG_OPEN_BYTES: bytes = COG_OPEN.encode()
+_COG_END_BYTES: bytes = COG_END.encode()
 
 # Stub template code — a no-op that produces no output when Cog processes it.
 # Replace this with real template logic for your repository.
@@ -46,7 +55,7 @@ class PrepareResult(BaseModel):
 
 def get_template_code() -> TemplateOutput:
     """Return the Cog template code."""
-    return TemplateOutput(code=TEMPLATE_CODE)
+    return TemplateOutput.model_construct(code=TEMPLATE_CODE)
 
 
 def wrap_with_cog(code: str) -> str:
@@ -54,24 +63,58 @@ def wrap_with_cog(code: str) -> str:
     return f"{COG_OPEN}\n{code}\n{COG_CLOSE}\n{COG_END}"
 
 
+# Both inputs are module constants, so the block ``apply`` inserts is built once.
+_WRAPPED_TEMPLATE: str = wrap_with_cog(TEMPLATE_CODE)
+
+
+def _write_atomic(path: Path, *chunks: bytes | memoryview) -> None:
+    """Write *chunks* to a temp file beside *path*, then move it into place.
+
+    Readers never see a half-written README, and its permission bits are kept.
+    A symlinked README is written through, so the link itself survives.
+    """
+    path = path.resolve()
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "wb") as tmp:
+            for chunk in chunks:
+                tmp.write(chunk)
+        shutil.copymode(path, tmp_name)
+        os.replace(tmp_name, path)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
+
+
+def apply_template_str(content: str) -> tuple[str, bool]:
+    """Replace the last placeholder in *content* with the Cog-wrapped template.
+
+    This is the pure core of ``apply_template``.  Returns
+    ``(new_content, placeholder_found)``; *content* comes back unchanged
+    when the placeholder is absent.
+    """
+    head, sep, tail = content.rpartition(PLACEHOLDER)
+    if not sep:
+        return content, False
+    return head + _WRAPPED_TEMPLATE + tail, True
+
+
 def apply_template(readme_path: Path) -> ApplyResult:
     """Replace the last occurrence of the placeholder in a README with the Cog-wrapped template.
 
     Returns an ApplyResult describing what happened.
     """
-    content = readme_path.read_text()
-    idx = content.rfind(PLACEHOLDER)
-    if idx == -1:
-        return ApplyResult(
+    data = readme_path.read_bytes()
+    if _PLACEHOLDER_BYTES not in data:
+        return ApplyResult.model_construct(
             readme_path=str(readme_path),
             placeholder_found=False,
             content_written=False,
         )
 
-    wrapped = wrap_with_cog(TEMPLATE_CODE)
-    new_content = content[:idx] + wrapped + content[idx + len(PLACEHOLDER) :]
-    readme_path.write_text(new_content)
-    return ApplyResult(
+    new_content, _ = apply_template_str(data.decode())
+    _write_atomic(readme_path, new_content.encode())
+    return ApplyResult.model_construct(
         readme_path=str(readme_path),
         placeholder_found=True,
         content_written=True,
@@ -88,27 +131,27 @@ def prepare_template(readme_path: Path) -> PrepareResult:
 
     Returns a PrepareResult describing what happened.
     """
-    content = readme_path.read_text()
+    data = readme_path.read_bytes()
     # Find the last Cog opening marker
-    cog_start = content.rfind(COG_OPEN)
+    cog_start = data.rfind(_COG_OPEN_BYTES)
     if cog_start == -1:
-        return PrepareResult(
+        return PrepareResult.model_construct(
             readme_path=str(readme_path),
             cog_block_found=False,
             placeholder_written=False,
         )
     # Find the corresponding end marker after the opening
-    cog_end = content.find(COG_END, cog_start)
+    cog_end = data.find(_COG_END_BYTES, cog_start)
     if cog_end == -1:
-        return PrepareResult(
+        return PrepareResult.model_construct(
             readme_path=str(readme_path),
             cog_block_found=False,
             placeholder_written=False,
         )
-    block_end = cog_end + len(COG_END)
-    new_content = content[:cog_start] + PLACEHOLDER + content[block_end:]
-    readme_path.write_text(new_content)
-    return PrepareResult(
+    block_end = cog_end + len(_COG_END_BYTES)
+    view = memoryview(data)
+    _write_atomic(readme_path, view[:cog_start], _PLACEHOLDER_BYTES, view[block_end:])
+    return PrepareResult.model_construct(
         readme_path=str(readme_path),
         cog_block_found=True,
         placeholder_written=True,
@@ -9,6 +9,8 @@ import json
 import os
 import re
 import shutil
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import pathspec
@@ -48,6 +50,21 @@ TEMPLATE_FILENAMES = {
     "Procfile",
 }
 
+_PACKAGE_VAR = "{{cookiecutter.package_name}}"
+
+# Rewrites applied to the first match only, keyed by file name and then by
+# the named group that captures the text kept ahead of the replacement.
+_FILE_SUBSTITUTIONS: dict[str, dict[str, tuple[str, str]]] = {
+    "pyproject.toml": {
+        "name": (r'(?P<name>name\s*=\s*)"[^"]+"', '"{{cookiecutter.project_slug}}"'),
+        "description": (
+            r'(?P<description>description\s*=\s*)"[^"]+"',
+            '"My take on {{cookiecutter.project_name}}"',
+        ),
+    },
+    "README.md": {"heading": (r"^(?P<heading>)#\s+[^\r\n]+", f"# {_PACKAGE_VAR}")},
+}
+
 
 class GeneralizeArgs(BaseModel):
     """Validated inputs for the generalize command."""
@@ -73,20 +90,14 @@ def detect_package_dir(src: Path) -> str | None:
     return None
 
 
-def _should_exclude(path: Path, excludes: set[str]) -> bool:
-    parts = set(path.parts)
-    return any(part in excludes for part in parts)
-
-
 def _is_templatable_file(path: Path) -> bool:
     return path.suffix in TEMPLATE_EXTENSIONS or path.name in TEMPLATE_FILENAMES
 
 
-def _safe_read_text(path: Path) -> str | None:
-    try:
-        return path.read_text(encoding="utf-8")
-    except UnicodeDecodeError:
-        return None
+def _copy_verbatim(src_file: Path, dest_file: Path) -> None:
+    """Copy file data and permission bits; timestamps don't matter in a template."""
+    shutil.copyfile(src_file, dest_file)
+    shutil.copymode(src_file, dest_file)
 
 
 def _load_gitignore_spec(src: Path) -> pathspec.PathSpec | None:
@@ -98,92 +109,112 @@ def _load_gitignore_spec(src: Path) -> pathspec.PathSpec | None:
     )
 
 
-def _load_gitattributes_binaries(src: Path) -> set[str]:
+def _load_gitattributes_binaries(src: Path) -> pathspec.PathSpec:
+    """Compile every ``binary`` pattern in ``.gitattributes`` into one spec."""
     ga = src / ".gitattributes"
-    binaries: set[str] = set()
-    if not ga.exists():
-        return binaries
-    for line in ga.read_text().splitlines():
-        parts = line.split()
-        if len(parts) >= 2 and "binary" in parts[1:]:
-            binaries.add(parts[0])
-    return binaries
+    patterns: list[str] = []
+    if ga.exists():
+        for line in ga.read_text().splitlines():
+            parts = line.split()
+            if len(parts) >= 2 and "binary" in parts[1:]:
+                patterns.append(parts[0])
+    return pathspec.PathSpec.from_lines("gitwildmatch", patterns)
+
 
+def _compile_substitutions(
+    package_name: str | None,
+) -> dict[tuple[str, bool], re.Pattern[str]]:
+    """Fold each file's rewrites into one alternation, with and without the package.
 
-def _is_binary_by_gitattributes(rel_path: str, binary_patterns: set[str]) -> bool:
-    for pattern in binary_patterns:
-        if pathspec.PathSpec.from_lines("gitwildmatch", [pattern]).match_file(rel_path):
-            return True
-    return False
+    Keys are ``(file_name, with_package)``; ``("", True)`` is the package
+    rename alone, used for every other file.  The ``with_package`` variants
+    are absent when no package directory was detected.
+    """
+    package_alt = rf"(?P<pkg>\b{re.escape(package_name)}\b)" if package_name else None
+    patterns: dict[tuple[str, bool], re.Pattern[str]] = {}
+    for file_name, subs in _FILE_SUBSTITUTIONS.items():
+        alts = [alt for alt, _ in subs.values()]
+        patterns[file_name, False] = re.compile("|".join(alts))
+        if package_alt:
+            patterns[file_name, True] = re.compile("|".join([*alts, package_alt]))
+    if package_alt:
+        patterns["", True] = re.compile(package_alt)
+    return patterns
 
 
 def _apply_template_substitutions(
-    content: str, src_file: Path, package_name: str | None
+    content: str,
+    src_file: Path,
+    patterns: dict[tuple[str, bool], re.Pattern[str]],
+    has_package: bool,
 ) -> str:
-    """Replace project-specific values with cookiecutter template variables."""
-    if package_name:
-        content = re.sub(
-            rf"\b{re.escape(package_name)}\b",
-            "{{cookiecutter.package_name}}",
-            content,
-        )
-
-    if src_file.name == "pyproject.toml":
-        content = re.sub(
-            r'(name\s*=\s*)"[^"]+"',
-            r'\1"{{cookiecutter.project_slug}}"',
-            content,
-            count=1,
-        )
-        content = re.sub(
-            r'(description\s*=\s*)"[^"]+"',
-            r'\1"My take on {{cookiecutter.project_name}}"',
-            content,
-            count=1,
-        )
-
-    if src_file.name == "README.md":
-        content = re.sub(
-            r"^#\s+.+",
-            "# {{cookiecutter.package_name}}",
-            content,
-            count=1,
-        )
-
-    return content
+    """Replace project-specific values with cookiecutter template variables.
+
+    *has_package* says whether the package name occurs in *content* at all;
+    when it doesn't, the package alternative is left out of the scan.
+    """
+    package_re = patterns.get(("", True)) if has_package else None
+    file_subs = _FILE_SUBSTITUTIONS.get(src_file.name)
+    if file_subs is None:
+        return package_re.sub(_PACKAGE_VAR, content) if package_re else content
+
+    done: set[str] = set()
+
+    def _replace(match: re.Match[str]) -> str:
+        kind = match.lastgroup
+        if kind is None or kind == "pkg":
+            return _PACKAGE_VAR
+        if kind in done:
+            # Only the first match is rewritten; later ones keep their value
+            # but still get the package rename.
+            return package_re.sub(_PACKAGE_VAR, match[0]) if package_re else match[0]
+        done.add(kind)
+        return match[kind] + file_subs[kind][1]
+
+    return patterns[src_file.name, package_re is not None].sub(_replace, content)
 
 
 def _process_file(
     src_file: Path,
     dest_file: Path,
     rel_file: str,
-    package_name: str | None,
-    binary_patterns: set[str],
+    patterns: dict[tuple[str, bool], re.Pattern[str]],
+    package_probe: bytes | None,
+    binary_spec: pathspec.PathSpec,
 ) -> None:
-    """Process a single file: apply template substitutions or copy as-is."""
-    file_is_binary = _is_binary_by_gitattributes(rel_file, binary_patterns)
+    """Process a single file: apply template substitutions or copy as-is.
 
-    if file_is_binary or not _is_templatable_file(src_file):
-        shutil.copy2(src_file, dest_file)
+    Files without their own rewrites are only decoded and scanned when
+    *package_probe* (the encoded package name) occurs in their bytes.
+    """
+    if binary_spec.match_file(rel_file) or not _is_templatable_file(src_file):
+        _copy_verbatim(src_file, dest_file)
         return
 
-    content = _safe_read_text(src_file)
-    if content is None:
-        shutil.copy2(src_file, dest_file)
-        return
+    data = src_file.read_bytes()
+    has_package = package_probe is not None and package_probe in data
+    if has_package or src_file.name in _FILE_SUBSTITUTIONS:
+        try:
+            content = data.decode("utf-8")
+        except UnicodeDecodeError:
+            pass  # not text after all: keep the bytes already read
+        else:
+            content = _apply_template_substitutions(
+                content, src_file, patterns, has_package
+            )
+            data = content.encode("utf-8")
 
-    content = _apply_template_substitutions(content, src_file, package_name)
-    dest_file.write_text(content, encoding="utf-8")
+    dest_file.write_bytes(data)
+    shutil.copymode(src_file, dest_file)
 
 
-def _template_dir_parts(parts: tuple[str, ...], package_name: str | None) -> list[str]:
+def _template_dir_parts(
+    parts: tuple[str, ...], package_name: str | None
+) -> tuple[str, ...]:
     """Map directory path parts to cookiecutter template variables."""
-    return [
-        "{{cookiecutter.package_name}}"
-        if package_name and part == package_name
-        else part
-        for part in parts
-    ]
+    if not package_name or package_name not in parts:
+        return parts
+    return tuple(_PACKAGE_VAR if part == package_name else part for part in parts)
 
 
 def generalize(args: GeneralizeArgs) -> GeneralizeResult:
@@ -205,7 +236,9 @@ def generalize(args: GeneralizeArgs) -> GeneralizeResult:
 
     excludes = set(DEFAULT_EXCLUDES)
     gitignore_spec = _load_gitignore_spec(src)
-    binary_patterns = _load_gitattributes_binaries(src)
+    binary_spec = _load_gitattributes_binaries(src)
+    patterns = _compile_substitutions(package_name)
+    package_probe = package_name.encode() if package_name else None
 
     if template_root.exists():
         raise SystemExit(f"Template folder already exists: {template_root}")
@@ -226,50 +259,43 @@ def generalize(args: GeneralizeArgs) -> GeneralizeResult:
     project_root = template_root / "{{cookiecutter.project_slug}}"
     project_root.mkdir()
 
-    for root, dirs, files in os.walk(src):
-        root_path = Path(root)
-        if _should_exclude(root_path, excludes):
-            continue
-
-        rel_root = root_path.relative_to(src)
-        if rel_root == Path("."):
-            rel_root = Path()
-
-        if gitignore_spec and rel_root != Path():
-            rel_root_str = str(rel_root) + "/"
-            if gitignore_spec.match_file(rel_root_str):
-                dirs.clear()
-                continue
-
-        rel_parts = _template_dir_parts(rel_root.parts, package_name)
-        dest_root = project_root.joinpath(*rel_parts)
+    # Breadth-first walk over os.scandir so each entry's type comes from the
+    # cached DirEntry and each relative path is matched against .gitignore
+    # exactly once.  Symlinked directories are skipped, as with os.walk.
+    # Destination directories are created here; files are queued as jobs.
+    jobs: list[tuple[Path, Path, str]] = []
+    pending: deque[tuple[str, tuple[str, ...]]] = deque([(str(src), ())])
+    while pending:
+        root, rel_parts = pending.popleft()
+        rel_prefix = "".join(f"{part}/" for part in rel_parts)
+        dest_root = project_root.joinpath(*_template_dir_parts(rel_parts, package_name))
         dest_root.mkdir(parents=True, exist_ok=True)
 
-        dirs[:] = [
-            d
-            for d in dirs
-            if not _should_exclude(root_path / d, excludes)
-            and not (
-                gitignore_spec
-                and gitignore_spec.match_file(
-                    str((rel_root / d) if rel_root != Path() else Path(d)) + "/"
-                )
-            )
-        ]
+        with os.scandir(root) as entries:
+            for entry in entries:
+                if entry.name in excludes:
+                    continue
 
-        for file_name in files:
-            if file_name in excludes:
-                continue
+                rel_path = rel_prefix + entry.name
+                if entry.is_dir():
+                    if not entry.is_symlink() and not (
+                        gitignore_spec and gitignore_spec.match_file(rel_path + "/")
+                    ):
+                        pending.append((entry.path, (*rel_parts, entry.name)))
+                    continue
 
-            src_file = root_path / file_name
-            rel_file = str(rel_root / file_name) if rel_root != Path() else file_name
+                if gitignore_spec and gitignore_spec.match_file(rel_path):
+                    continue
 
-            if gitignore_spec and gitignore_spec.match_file(rel_file):
-                continue
+                jobs.append((Path(entry.path), dest_root / entry.name, rel_path))
 
-            _process_file(
-                src_file, dest_root / file_name, rel_file, package_name, binary_patterns
-            )
+    # Each file is independent and dominated by reads, writes and copies,
+    # which release the GIL.  list() re-raises the first worker error.
+    def _run(job: tuple[Path, Path, str]) -> None:
+        _process_file(*job, patterns, package_probe, binary_spec)
+
+    with ThreadPoolExecutor() as executor:
+        list(executor.map(_run, jobs))
 
     return GeneralizeResult(
         template_root=template_root,
@@ -9,6 +9,7 @@ from __future__ import annotations
 import difflib
 import json
 import re
+import string
 from pathlib import Path
 from typing import Literal
 
@@ -89,11 +90,17 @@ class FeatureDiff(BaseModel):
 # Parsing
 # ---------------------------------------------------------------------------
 
-COMMENT_PATTERN = re.compile(r"^\s*#\s*(.*)$")
-PHONY_PATTERN = re.compile(r"^\.PHONY\s*:\s*(.*)$")
-DEFAULT_GOAL_PATTERN = re.compile(r"^\.DEFAULT_GOAL\s*:=\s*(.*)$")
-VAR_PATTERN = re.compile(r"^([A-Za-z_.][A-Za-z0-9_.]*)\s*(\?=|:=|\+=|!=|=)\s*(.*)$")
-TARGET_PATTERN = re.compile(r"^([a-zA-Z_.][a-zA-Z0-9_./%-]*)\s*:(?!=)(.*)$")
+# Every non-recipe, non-comment line is matched once against this
+# alternation; ``lastgroup`` names the branch that matched.  Branches are
+# tried in order, so the dot directives win over the generic variable and
+# target forms, and variables win over targets.
+LINE_PATTERN = re.compile(
+    r"(?P<phony>\.PHONY\s*:\s*(?P<phony_names>.*))"
+    r"|(?P<goal>\.DEFAULT_GOAL\s*:=\s*(?P<goal_name>.*))"
+    r"|(?P<var>(?P<var_name>[A-Za-z_.][A-Za-z0-9_.]*)\s*"
+    r"(?P<operator>\?=|:=|\+=|!=|=)\s*(?P<value>.*))"
+    r"|(?P<target>(?P<target_name>[a-zA-Z_.][a-zA-Z0-9_./%-]*)\s*:(?!=)(?P<deps>.*))"
+)
 HELP_PRINTF_PATTERN = re.compile(r'@printf\s+"%-\d+s\s+%s\\n"\s+"([^"]+)"\s+"([^"]*)"')
 
 
@@ -101,7 +108,8 @@ def _extract_help_entry(
     recipe_line: str, current_target: str, help_entries: dict[str, str]
 ) -> None:
     """Parse help printf lines from a 'help' target recipe."""
-    if current_target != "help":
+    # Cheap substring test first; most help recipe lines are not printf rows.
+    if current_target != "help" or "@printf" not in recipe_line:
         return
     if help_match := HELP_PRINTF_PATTERN.search(recipe_line):
         target_name = help_match.group(1)
@@ -110,69 +118,93 @@ def _extract_help_entry(
             help_entries[target_name] = description
 
 
-def parse_makefile(path: Path) -> MakefileStructure:
-    """Parse a Makefile into a structured representation."""
+def _add_recipe_line(
+    recipe_line: str,
+    current_target: str | None,
+    targets: dict[str, MakefileTarget],
+    help_entries: dict[str, str],
+) -> None:
+    """Append a tab-indented line to the current target's recipe, if any."""
+    if not current_target:
+        return
+    targets[current_target].recipe.append(recipe_line)
+    _extract_help_entry(recipe_line, current_target, help_entries)
+
+
+def _parse_definition(
+    match: re.Match[str], comments: list[str]
+) -> MakefileVariable | MakefileTarget:
+    """Build the variable or target for a ``var`` / ``target`` line match.
+
+    *comments* is passed straight through: model validation already copies
+    the list, so the caller can clear and reuse it.
+    """
+    if match.lastgroup == "var":
+        return MakefileVariable(
+            name=match["var_name"],
+            operator=match["operator"],
+            value=match["value"].strip(),
+            comments=comments,
+        )
+    deps_str = match["deps"].strip()
+    return MakefileTarget(
+        name=match["target_name"],
+        dependencies=deps_str.split() if deps_str else [],
+        recipe=[],
+        comments=comments,
+    )
+
+
+def parse_makefile(path: Path, text: str | None = None) -> MakefileStructure:
+    """Parse a Makefile into a structured representation.
+
+    Pass *text* when the file has already been read.
+    """
+    if text is None:
+        text = path.read_text(encoding="utf-8")
     variables: dict[str, MakefileVariable] = {}
     targets: dict[str, MakefileTarget] = {}
     phony_targets: set[str] = set()
     default_goal: str | None = None
     help_entries: dict[str, str] = {}
 
-    lines = path.read_text(encoding="utf-8").splitlines()
+    lines = text.splitlines()
     pending_comments: list[str] = []
     current_target: str | None = None
 
     for line in lines:
-        if not line.strip():
-            pending_comments.clear()
-            continue
-
-        if match := COMMENT_PATTERN.match(line):
-            pending_comments.append(match.group(1))
-            continue
-
-        if match := PHONY_PATTERN.match(line):
-            phony_targets.update(match.group(1).strip().split())
+        # Dispatch on the first character: comments (any indentation) and
+        # recipes need no regex, everything else gets one LINE_PATTERN match.
+        stripped = line.lstrip()
+        if not stripped:
             pending_comments.clear()
             continue
 
-        if match := DEFAULT_GOAL_PATTERN.match(line):
-            default_goal = match.group(1).strip()
-            pending_comments.clear()
-            continue
-
-        if line.startswith("\t"):
-            if current_target:
-                recipe_line = line[1:]
-                targets[current_target].recipe.append(recipe_line)
-                _extract_help_entry(recipe_line, current_target, help_entries)
-            pending_comments.clear()
+        if stripped[0] == "#":
+            pending_comments.append(stripped[1:].lstrip())
             continue
 
-        if match := VAR_PATTERN.match(line):
-            var_name = match.group(1)
-            variables[var_name] = MakefileVariable(
-                name=var_name,
-                operator=match.group(2),
-                value=match.group(3).strip(),
-                comments=pending_comments.copy(),
-            )
+        if line[0] == "\t":
+            _add_recipe_line(line[1:], current_target, targets, help_entries)
             pending_comments.clear()
             continue
 
-        if match := TARGET_PATTERN.match(line):
-            target_name = match.group(1)
-            deps_str = match.group(2).strip()
-            targets[target_name] = MakefileTarget(
-                name=target_name,
-                dependencies=deps_str.split() if deps_str else [],
-                recipe=[],
-                comments=pending_comments.copy(),
-            )
-            current_target = target_name
+        match = LINE_PATTERN.match(line)
+        if match is None:
             pending_comments.clear()
             continue
 
+        if match.lastgroup == "phony":
+            phony_targets.update(match["phony_names"].split())
+        elif match.lastgroup == "goal":
+            default_goal = match["goal_name"].strip()
+        else:
+            definition = _parse_definition(match, pending_comments)
+            if isinstance(definition, MakefileVariable):
+                variables[definition.name] = definition
+            else:
+                targets[definition.name] = definition
+                current_target = definition.name
         pending_comments.clear()
 
     return MakefileStructure(
@@ -212,35 +244,39 @@ def _detect_variable_changes(
 ) -> dict[str, VariableChange]:
     """Find variables that exist in both but differ in value or operator."""
     changed: dict[str, VariableChange] = {}
-    for name in src.variables:
-        if name in tgt.variables:
-            src_var = src.variables[name]
-            tgt_var = tgt.variables[name]
-            if src_var.value != tgt_var.value or src_var.operator != tgt_var.operator:
-                changed[name] = VariableChange(
-                    old_value=tgt_var.value,
-                    new_value=src_var.value,
-                    old_operator=tgt_var.operator,
-                    new_operator=src_var.operator,
-                )
+    tgt_variables = tgt.variables
+    for name, src_var in src.variables.items():
+        tgt_var = tgt_variables.get(name)
+        if tgt_var is not None and (
+            src_var.value != tgt_var.value or src_var.operator != tgt_var.operator
+        ):
+            changed[name] = VariableChange(
+                old_value=tgt_var.value,
+                new_value=src_var.value,
+                old_operator=tgt_var.operator,
+                new_operator=src_var.operator,
+            )
     return changed
 
 
 def detect_features(src: MakefileStructure, tgt: MakefileStructure) -> FeatureDiff:
     """Identify discrete features in source that are absent/different in target."""
-    new_targets = [name for name in src.targets if name not in tgt.targets]
-    removed_targets = [name for name in tgt.targets if name not in src.targets]
+    # One pass over the source targets, in source order, sorts each into new
+    # or modified; dict key lookups are already hash lookups.
+    src_targets = src.targets
+    tgt_targets = tgt.targets
+    new_targets: list[str] = []
     modified_targets: list[str] = []
-
-    for name in src.targets:
-        if name in tgt.targets:
-            src_target = src.targets[name]
-            tgt_target = tgt.targets[name]
-            if (
-                src_target.dependencies != tgt_target.dependencies
-                or src_target.recipe != tgt_target.recipe
-            ):
-                modified_targets.append(name)
+    for name, src_target in src_targets.items():
+        tgt_target = tgt_targets.get(name)
+        if tgt_target is None:
+            new_targets.append(name)
+        elif (
+            src_target.dependencies != tgt_target.dependencies
+            or src_target.recipe != tgt_target.recipe
+        ):
+            modified_targets.append(name)
+    removed_targets = [name for name in tgt_targets if name not in src_targets]
 
     new_variables: dict[str, VariableInfo] = {
         name: VariableInfo(
@@ -266,13 +302,71 @@ def detect_features(src: MakefileStructure, tgt: MakefileStructure) -> FeatureDi
 # ---------------------------------------------------------------------------
 
 
-def generate_diff(src_path: Path, tgt_path: Path) -> str:
-    """Generate unified diff between two files."""
-    src_lines = src_path.read_text(encoding="utf-8").splitlines(keepends=True)
-    tgt_lines = tgt_path.read_text(encoding="utf-8").splitlines(keepends=True)
+_DIFF_CONTEXT = 3
+_HUNK_HEADER_PATTERN = re.compile(r"@@ -(\d+)(,\d+)? \+(\d+)(,\d+)? @@")
+
+
+def _diff_trim(a: list[str], b: list[str]) -> tuple[int, int]:
+    """Count leading / trailing lines shared by *a* and *b* that a diff can skip.
+
+    Each count leaves ``_DIFF_CONTEXT`` shared lines in place so hunks next
+    to the trimmed region keep their full context.
+    """
+    limit = min(len(a), len(b))
+    head = 0
+    while head < limit and a[head] == b[head]:
+        head += 1
+    tail = 0
+    while tail < limit - head and a[-1 - tail] == b[-1 - tail]:
+        tail += 1
+    return max(head - _DIFF_CONTEXT, 0), max(tail - _DIFF_CONTEXT, 0)
+
+
+def _shift_hunk_header(header: str, offset: int) -> str:
+    """Move the line numbers of a ``@@ -a,b +c,d @@`` header down by *offset*."""
+    match = _HUNK_HEADER_PATTERN.fullmatch(header)
+    if match is None:
+        return header
+    old_start, old_len, new_start, new_len = match.groups("")
+    return (
+        f"@@ -{int(old_start) + offset}{old_len} +{int(new_start) + offset}{new_len} @@"
+    )
+
+
+def generate_diff(
+    src_path: Path,
+    tgt_path: Path,
+    src_text: str | None = None,
+    tgt_text: str | None = None,
+) -> str:
+    """Generate unified diff between two files.
+
+    *src_text* / *tgt_text* stand in for the file contents when already read.
+    Leading and trailing lines the files share are trimmed before matching,
+    since ``SequenceMatcher`` cost grows with the lines it has to compare;
+    hunk headers are shifted back to whole-file line numbers.
+    """
+    if src_text is None:
+        src_text = src_path.read_text(encoding="utf-8")
+    if tgt_text is None:
+        tgt_text = tgt_path.read_text(encoding="utf-8")
+    if src_text == tgt_text:
+        return ""
+    src_lines = src_text.splitlines(keepends=True)
+    tgt_lines = tgt_text.splitlines(keepends=True)
+    head, tail = _diff_trim(tgt_lines, src_lines)
     diff = difflib.unified_diff(
-        tgt_lines, src_lines, fromfile=str(tgt_path), tofile=str(src_path), lineterm=""
+        tgt_lines[head : len(tgt_lines) - tail],
+        src_lines[head : len(src_lines) - tail],
+        fromfile=str(tgt_path),
+        tofile=str(src_path),
+        lineterm="",
     )
+    if head:
+        diff = (
+            _shift_hunk_header(line, head) if line.startswith("@@") else line
+            for line in diff
+        )
     return "".join(diff)
 
 
@@ -284,6 +378,15 @@ OPERATOR_DESCRIPTIONS = {
     "!=": "shell assignment",
 }
 
+# Shorter labels for the prompt, which appends " assignment" itself.
+PROMPT_OPERATOR_KINDS = {
+    "?=": "conditional",
+    ":=": "immediate",
+    "=": "recursive",
+    "+=": "append",
+    "!=": "shell",
+}
+
 
 def _format_targets_section(features: FeatureDiff, src: MakefileStructure) -> list[str]:
     """Format new and modified target sections."""
@@ -440,6 +543,24 @@ For each feature, evaluate:
 Please provide a structured analysis for merging these features.
 """
 
+# (literal, field) pairs of CLAUDE_PROMPT_TEMPLATE, split once so
+# format_prompt can join the pieces directly instead of running str.format
+# over the full file contents on every call.
+_PROMPT_SEGMENTS = [
+    (literal, field)
+    for literal, field, _, _ in string.Formatter().parse(CLAUDE_PROMPT_TEMPLATE)
+]
+
+
+def _render_prompt(fields: dict[str, str]) -> str:
+    """Fill CLAUDE_PROMPT_TEMPLATE from *fields* with a single join."""
+    out: list[str] = []
+    for literal, field in _PROMPT_SEGMENTS:
+        out.append(literal)
+        if field is not None:
+            out.append(fields[field])
+    return "".join(out)
+
 
 def format_prompt(
     features: FeatureDiff,
@@ -447,8 +568,14 @@ def format_prompt(
     src_path: Path,
     tgt_path: Path,
     diff: str,
+    src_content: str | None = None,
+    tgt_content: str | None = None,
 ) -> str:
-    """Structured prompt for Claude analysis."""
+    """Structured prompt for Claude analysis.
+
+    *src_content* / *tgt_content* stand in for the file contents when already
+    read.
+    """
     new_targets_list = []
     for name in features.new_targets:
         target = src.targets[name]
@@ -475,13 +602,7 @@ def format_prompt(
 
     new_variables_list = []
     for name, var in features.new_variables.items():
-        operator_desc = {
-            "?=": "conditional",
-            ":=": "immediate",
-            "=": "recursive",
-            "+=": "append",
-            "!=": "shell",
-        }.get(var.operator, var.operator)
+        operator_desc = PROMPT_OPERATOR_KINDS.get(var.operator, var.operator)
         new_variables_list.append(
             f"  - {name} {var.operator} {var.value} [{operator_desc} assignment]"
         )
@@ -513,31 +634,38 @@ def format_prompt(
                 help_changes_list.append(f"  - {entry_name}: {desc}")
     help_changes_str = "\n".join(help_changes_list) if help_changes_list else "  (none)"
 
-    src_content = src_path.read_text(encoding="utf-8")
-    tgt_content = tgt_path.read_text(encoding="utf-8")
-
-    return CLAUDE_PROMPT_TEMPLATE.format(
-        src_path=src_path,
-        tgt_path=tgt_path,
-        new_targets_count=len(features.new_targets),
-        new_targets=new_targets_str,
-        modified_targets_count=len(features.modified_targets),
-        modified_targets=modified_targets_str,
-        removed_targets_count=len(features.removed_targets),
-        removed_targets=removed_targets_str,
-        new_variables_count=len(features.new_variables),
-        new_variables=new_variables_str,
-        changed_variables_count=len(features.changed_variables),
-        changed_variables=changed_variables_str,
-        new_phony_count=len(features.new_phony),
-        new_phony=new_phony_str,
-        help_changes_count=len(features.help_changes) if features.help_changes else 0,
-        help_changes=help_changes_str,
-        src_content=src_content,
-        tgt_content=tgt_content,
-        diff=diff,
+    src_content = (
+        src_path.read_text(encoding="utf-8") if src_content is None else src_content
+    )
+    tgt_content = (
+        tgt_path.read_text(encoding="utf-8") if tgt_content is None else tgt_content
     )
 
+    fields = {
+        "src_path": str(src_path),
+        "tgt_path": str(tgt_path),
+        "new_targets_count": str(len(features.new_targets)),
+        "new_targets": new_targets_str,
+        "modified_targets_count": str(len(features.modified_targets)),
+        "modified_targets": modified_targets_str,
+        "removed_targets_count": str(len(features.removed_targets)),
+        "removed_targets": removed_targets_str,
+        "new_variables_count": str(len(features.new_variables)),
+        "new_variables": new_variables_str,
+        "changed_variables_count": str(len(features.changed_variables)),
+        "changed_variables": changed_variables_str,
+        "new_phony_count": str(len(features.new_phony)),
+        "new_phony": new_phony_str,
+        "help_changes_count": str(
+            len(features.help_changes) if features.help_changes else 0
+        ),
+        "help_changes": help_changes_str,
+        "src_content": src_content,
+        "tgt_content": tgt_content,
+        "diff": diff,
+    }
+    return _render_prompt(fields)
+
 
 def format_json(features: FeatureDiff) -> str:
     """Machine-readable JSON output."""
@@ -582,15 +710,24 @@ def meld_makefiles(args: MeldMakefilesArgs) -> str:
     if not tgt_path.exists():
         raise SystemExit(f"Target file not found: {tgt_path}")
 
-    src = parse_makefile(src_path)
-    tgt = parse_makefile(tgt_path)
+    # Read each file once and share the text with the parser and formatters.
+    src_text = src_path.read_text(encoding="utf-8")
+    tgt_text = tgt_path.read_text(encoding="utf-8")
+
+    # Only the diff and prompt outputs need the unified diff, and the diff
+    # output needs nothing else.
+    if args.output == "diff":
+        return generate_diff(src_path, tgt_path, src_text, tgt_text)
+
+    src = parse_makefile(src_path, src_text)
+    tgt = parse_makefile(tgt_path, tgt_text)
     features = detect_features(src, tgt)
-    diff = generate_diff(src_path, tgt_path)
 
     if args.output == "json":
         return format_json(features)
-    if args.output == "diff":
-        return diff
     if args.output == "prompt":
-        return format_prompt(features, src, src_path, tgt_path, diff)
+        diff = generate_diff(src_path, tgt_path, src_text, tgt_text)
+        return format_prompt(
+            features, src, src_path, tgt_path, diff, src_text, tgt_text
+        )
     return format_analysis(features, src, src_path, tgt_path)
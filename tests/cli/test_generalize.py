@@ -1,6 +1,7 @@
 import json
 from pathlib import Path
 
+import pytest
 from click.testing import CliRunner
 
 from recipes_cli.tui.cli import cli
@@ -75,6 +76,31 @@ def test_generalize_templates_pyproject_toml(runner: CliRunner, tmp_path: Path)
     assert "{{cookiecutter.project_name}}" in content
 
 
+def test_generalize_rewrites_only_first_pyproject_name(
+    runner: CliRunner, tmp_path: Path
+) -> None:
+    repo = _make_fake_repo(tmp_path)
+    (repo / "pyproject.toml").write_text(
+        '[project]\nname = "myproject"\n\n[tool.scripts]\nname = "mypackage"\n'
+    )
+    dst = tmp_path / "output"
+    dst.mkdir()
+
+    result = runner.invoke(cli, ["generalize", "--src", str(repo), "--dst", str(dst)])
+    assert result.exit_code == 0
+
+    pyproject = (
+        dst
+        / "cookiecutter-myproject"
+        / "{{cookiecutter.project_slug}}"
+        / "pyproject.toml"
+    )
+    assert pyproject.read_text() == (
+        '[project]\nname = "{{cookiecutter.project_slug}}"\n\n'
+        '[tool.scripts]\nname = "{{cookiecutter.package_name}}"\n'
+    )
+
+
 def test_generalize_templates_readme_heading(runner: CliRunner, tmp_path: Path) -> None:
     repo = _make_fake_repo(tmp_path)
     dst = tmp_path / "output"
@@ -112,17 +138,19 @@ def test_generalize_custom_template_name(runner: CliRunner, tmp_path: Path) -> N
     assert (dst / "my-custom-template" / "cookiecutter.json").exists()
 
 
-def test_generalize_src_defaults_to_cwd(runner: CliRunner, tmp_path: Path) -> None:
+def test_generalize_src_defaults_to_cwd(
+    runner: CliRunner, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
     """When --src is omitted, generalize should use the current directory."""
     repo = _make_fake_repo(tmp_path)
     dst = tmp_path / "output"
     dst.mkdir()
 
-    with runner.isolated_filesystem(temp_dir=repo) as td:
-        result = runner.invoke(cli, ["generalize", "--dst", str(dst)])
+    monkeypatch.chdir(repo)
+    result = runner.invoke(cli, ["generalize", "--dst", str(dst)])
 
     assert result.exit_code == 0
-    assert (dst / f"cookiecutter-{Path(td).name}").is_dir()
+    assert (dst / f"cookiecutter-{repo.name}").is_dir()
 
 
 def test_generalize_fails_if_template_exists(runner: CliRunner, tmp_path: Path) -> None:
@@ -158,3 +186,87 @@ def test_generalize_replaces_package_name_in_py_files(
     content = core_py.read_text()
     assert "{{cookiecutter.package_name}}" in content
     assert "mypackage" not in content
+
+
+def test_generalize_copies_gitattributes_binaries_verbatim(
+    runner: CliRunner, tmp_path: Path
+) -> None:
+    repo = _make_fake_repo(tmp_path)
+    (repo / ".gitattributes").write_text("*.json binary\n*.png binary\n")
+    (repo / "mypackage" / "data.json").write_text('{"pkg": "mypackage"}\n')
+    dst = tmp_path / "output"
+    dst.mkdir()
+
+    result = runner.invoke(cli, ["generalize", "--src", str(repo), "--dst", str(dst)])
+    assert result.exit_code == 0
+
+    data_json = (
+        dst
+        / "cookiecutter-myproject"
+        / "{{cookiecutter.project_slug}}"
+        / "{{cookiecutter.package_name}}"
+        / "data.json"
+    )
+    assert data_json.read_text() == '{"pkg": "mypackage"}\n'
+
+
+def test_generalize_skips_excluded_and_gitignored_paths(
+    runner: CliRunner, tmp_path: Path
+) -> None:
+    repo = _make_fake_repo(tmp_path)
+    (repo / ".gitignore").write_text("logs/\n*.log\n")
+    (repo / "logs").mkdir()
+    (repo / "logs" / "keep.txt").write_text("ignored via directory\n")
+    (repo / "debug.log").write_text("ignored via glob\n")
+    (repo / "__pycache__").mkdir()
+    (repo / "__pycache__" / "core.pyc").write_bytes(b"\x00")
+    (repo / "mypackage" / "sub").mkdir()
+    (repo / "mypackage" / "sub" / "util.py").write_text("import mypackage\n")
+    dst = tmp_path / "output"
+    dst.mkdir()
+
+    result = runner.invoke(cli, ["generalize", "--src", str(repo), "--dst", str(dst)])
+    assert result.exit_code == 0
+
+    skeleton = dst / "cookiecutter-myproject" / "{{cookiecutter.project_slug}}"
+    assert not (skeleton / "logs").exists()
+    assert not (skeleton / "debug.log").exists()
+    assert not (skeleton / "__pycache__").exists()
+    util_py = skeleton / "{{cookiecutter.package_name}}" / "sub" / "util.py"
+    assert util_py.read_text() == "import {{cookiecutter.package_name}}\n"
+
+
+def test_generalize_preserves_line_endings(runner: CliRunner, tmp_path: Path) -> None:
+    repo = _make_fake_repo(tmp_path)
+    (repo / "notes.txt").write_bytes(b"no substitutions here\r\n")
+    (repo / "mypackage" / "core.py").write_bytes(b"import mypackage\r\n")
+    dst = tmp_path / "output"
+    dst.mkdir()
+
+    result = runner.invoke(cli, ["generalize", "--src", str(repo), "--dst", str(dst)])
+    assert result.exit_code == 0
+
+    skeleton = dst / "cookiecutter-myproject" / "{{cookiecutter.project_slug}}"
+    assert (skeleton / "notes.txt").read_bytes() == b"no substitutions here\r\n"
+    core_py = skeleton / "{{cookiecutter.package_name}}" / "core.py"
+    assert core_py.read_bytes() == b"import {{cookiecutter.package_name}}\r\n"
+
+
+def test_generalize_keeps_executable_bits(runner: CliRunner, tmp_path: Path) -> None:
+    repo = _make_fake_repo(tmp_path)
+    script = repo / "run-me"
+    script.write_text("#!/bin/sh\necho hi\n")
+    script.chmod(0o755)
+    templated = repo / "mypackage" / "main.py"
+    templated.write_text("#!/usr/bin/env python\nimport mypackage\n")
+    templated.chmod(0o755)
+    dst = tmp_path / "output"
+    dst.mkdir()
+
+    result = runner.invoke(cli, ["generalize", "--src", str(repo), "--dst", str(dst)])
+    assert result.exit_code == 0
+
+    skeleton = dst / "cookiecutter-myproject" / "{{cookiecutter.project_slug}}"
+    assert (skeleton / "run-me").stat().st_mode & 0o777 == 0o755
+    main_py = skeleton / "{{cookiecutter.package_name}}" / "main.py"
+    assert main_py.stat().st_mode & 0o777 == 0o755
@@ -1,7 +1,19 @@
-from click.testing import CliRunner
+import re
+
+import pytest
+from click.testing import CliRunner, Result
 
 from recipes_cli.tui.cli import cli
 
+# Command names as they appear at the start of a ``Commands:`` listing row.
+_COMMAND_ROW_RE = re.compile(r"^\s+(generalize|help|meld)\b", re.M)
+
+
+@pytest.fixture(scope="module")
+def help_result(runner: CliRunner) -> Result:
+    """``recipes --help`` rendered once and shared by the help-text tests."""
+    return runner.invoke(cli, ["--help"])
+
 
 def test_no_args_shows_help(runner: CliRunner) -> None:
     result = runner.invoke(cli, [])
@@ -16,16 +28,14 @@ def test_help_subcommand(runner: CliRunner) -> None:
     assert "Recipes CLI" in result.output
 
 
-def test_help_flag(runner: CliRunner) -> None:
-    result = runner.invoke(cli, ["--help"])
-    assert result.exit_code == 0
-    assert "Recipes CLI" in result.output
+def test_help_flag(help_result: Result) -> None:
+    assert help_result.exit_code == 0
+    assert "Recipes CLI" in help_result.output
 
 
-def test_commands_listed_alphabetically(runner: CliRunner) -> None:
-    result = runner.invoke(cli, ["--help"])
-    commands_section = result.output[result.output.index("Commands:") :]
-    generalize_pos = commands_section.index("generalize")
-    help_pos = commands_section.index("help")
-    meld_pos = commands_section.index("meld")
-    assert generalize_pos < help_pos < meld_pos
+def test_commands_listed_alphabetically(help_result: Result) -> None:
+    _, _, commands_section = help_result.output.partition("Commands:")
+    positions = {
+        m.group(1): m.start() for m in _COMMAND_ROW_RE.finditer(commands_section)
+    }
+    assert positions["generalize"] < positions["help"] < positions["meld"]
@@ -1,9 +1,11 @@
 import json
 from pathlib import Path
+from typing import Any
 
 import pytest
-from click.testing import CliRunner
+from click.testing import CliRunner, Result
 
+from recipes_cli.meld import generate_diff, parse_makefile
 from recipes_cli.tui.cli import cli
 
 _SOURCE_MAKEFILE = """\
@@ -32,11 +34,16 @@ test:
 """
 
 
-@pytest.fixture()
-def meld_makefiles(tmp_path: Path) -> tuple[Path, Path]:
-    """Write the source and target Makefiles and return their paths."""
-    src = tmp_path / "source.mk"
-    tgt = tmp_path / "target.mk"
+@pytest.fixture(scope="module")
+def meld_makefiles(tmp_path_factory: pytest.TempPathFactory) -> tuple[Path, Path]:
+    """Write the source and target Makefiles once and return their paths.
+
+    Module-scoped: ``meld makefiles`` only reads its inputs, so every test
+    can share the same pair.
+    """
+    directory = tmp_path_factory.mktemp("meld")
+    src = directory / "source.mk"
+    tgt = directory / "target.mk"
     src.write_text(_SOURCE_MAKEFILE)
     tgt.write_text(_TARGET_MAKEFILE)
     return src, tgt
@@ -54,87 +61,125 @@ def test_meld_makefiles_appears_in_meld_help(runner: CliRunner) -> None:
     assert "makefiles" in result.output
 
 
-def test_meld_makefiles_analysis_output(
-    runner: CliRunner, meld_makefiles: tuple[Path, Path]
+@pytest.mark.parametrize(
+    ("args", "needles"),
+    [
+        # Analysis is the default output and lists the new targets
+        ([], ["lint", "deploy"]),
+        (["-o", "diff"], ["---", "+++"]),
+        (["-o", "prompt"], ["Analysis Request"]),
+    ],
+)
+def test_meld_makefiles_text_output(
+    runner: CliRunner,
+    meld_makefiles: tuple[Path, Path],
+    args: list[str],
+    needles: list[str],
 ) -> None:
     src, tgt = meld_makefiles
-    result = runner.invoke(cli, ["meld", "makefiles", str(src), str(tgt)])
+    result = runner.invoke(cli, ["meld", "makefiles", str(src), str(tgt), *args])
     assert result.exit_code == 0
-    # Should detect new targets
-    assert "lint" in result.output
-    assert "deploy" in result.output
+    for needle in needles:
+        assert needle in result.output
 
 
-def test_meld_makefiles_json_output(
-    runner: CliRunner, meld_makefiles: tuple[Path, Path]
-) -> None:
+@pytest.fixture(scope="module")
+def json_result(runner: CliRunner, meld_makefiles: tuple[Path, Path]) -> Result:
+    """``meld makefiles --output json`` run once and shared by the JSON tests."""
     src, tgt = meld_makefiles
-    result = runner.invoke(
+    return runner.invoke(
         cli, ["meld", "makefiles", str(src), str(tgt), "--output", "json"]
     )
-    assert result.exit_code == 0
-    data = json.loads(result.output)
-    assert "lint" in data["new_targets"]
-    assert "deploy" in data["new_targets"]
 
 
-def test_meld_makefiles_detects_modified_target(
-    runner: CliRunner, meld_makefiles: tuple[Path, Path]
-) -> None:
-    src, tgt = meld_makefiles
-    result = runner.invoke(cli, ["meld", "makefiles", str(src), str(tgt), "-o", "json"])
-    assert result.exit_code == 0
-    data = json.loads(result.output)
-    # test target has different recipe in source vs target
-    assert "test" in data["modified_targets"]
+@pytest.fixture(scope="module")
+def meld_json(json_result: Result) -> dict[str, Any]:
+    """The shared JSON run's output, parsed once."""
+    data: dict[str, Any] = json.loads(json_result.output)
+    return data
 
 
-def test_meld_makefiles_detects_new_variables(
-    runner: CliRunner, meld_makefiles: tuple[Path, Path]
-) -> None:
-    src, tgt = meld_makefiles
-    result = runner.invoke(cli, ["meld", "makefiles", str(src), str(tgt), "-o", "json"])
-    assert result.exit_code == 0
-    data = json.loads(result.output)
-    assert "DEPLOY_TARGET" in data["new_variables"]
+def test_meld_makefiles_json_output(json_result: Result) -> None:
+    assert json_result.exit_code == 0
 
 
-def test_meld_makefiles_diff_output(
-    runner: CliRunner, meld_makefiles: tuple[Path, Path]
+@pytest.mark.parametrize(
+    ("key", "member"),
+    [
+        ("new_targets", "lint"),
+        ("new_targets", "deploy"),
+        # test target has different recipe in source vs target
+        ("modified_targets", "test"),
+        ("new_variables", "DEPLOY_TARGET"),
+    ],
+)
+def test_meld_makefiles_json_reports(
+    meld_json: dict[str, Any], key: str, member: str
 ) -> None:
-    src, tgt = meld_makefiles
-    result = runner.invoke(cli, ["meld", "makefiles", str(src), str(tgt), "-o", "diff"])
-    assert result.exit_code == 0
-    assert "---" in result.output
-    assert "+++" in result.output
+    assert member in meld_json[key]
 
 
-def test_meld_makefiles_prompt_output(
+def test_generate_diff_reports_whole_file_line_numbers() -> None:
+    lines = [f"V{i} := {i}\n" for i in range(50)]
+    changed = lines.copy()
+    changed[30] = "V30 := thirty\n"
+    diff = generate_diff(
+        Path("src.mk"), Path("tgt.mk"), "".join(changed), "".join(lines)
+    )
+    assert diff.count("@@ -") == 1
+    assert "@@ -28,7 +28,7 @@" in diff
+    assert "-V30 := 30\n+V30 := thirty\n" in diff
+
+
+def test_generate_diff_identical_files_is_empty(tmp_path: Path) -> None:
+    src = tmp_path / "a.mk"
+    tgt = tmp_path / "b.mk"
+    src.write_text(_SOURCE_MAKEFILE)
+    tgt.write_text(_SOURCE_MAKEFILE)
+    assert generate_diff(src, tgt) == ""
+
+
+def test_meld_makefiles_nonexistent_source(
     runner: CliRunner, meld_makefiles: tuple[Path, Path]
 ) -> None:
-    src, tgt = meld_makefiles
+    _, tgt = meld_makefiles
     result = runner.invoke(
-        cli, ["meld", "makefiles", str(src), str(tgt), "-o", "prompt"]
+        cli, ["meld", "makefiles", str(tgt.parent / "nope.mk"), str(tgt)]
     )
-    assert result.exit_code == 0
-    assert "Analysis Request" in result.output
-
+    assert result.exit_code != 0
 
-def test_meld_makefiles_nonexistent_source(runner: CliRunner, tmp_path: Path) -> None:
-    tgt = tmp_path / "target.mk"
-    tgt.write_text(_TARGET_MAKEFILE)
 
+def test_meld_makefiles_nonexistent_target(
+    runner: CliRunner, meld_makefiles: tuple[Path, Path]
+) -> None:
+    src, _ = meld_makefiles
     result = runner.invoke(
-        cli, ["meld", "makefiles", str(tmp_path / "nope.mk"), str(tgt)]
+        cli, ["meld", "makefiles", str(src), str(src.parent / "nope.mk")]
     )
     assert result.exit_code != 0
 
 
-def test_meld_makefiles_nonexistent_target(runner: CliRunner, tmp_path: Path) -> None:
+def test_meld_makefiles_collects_indented_comments(
+    runner: CliRunner, tmp_path: Path
+) -> None:
     src = tmp_path / "source.mk"
-    src.write_text(_SOURCE_MAKEFILE)
+    tgt = tmp_path / "target.mk"
+    src.write_text("#plain\n  #  indented\n\t# tabbed\nNEW_VAR ?= 1\n")
+    tgt.write_text("\n")
 
-    result = runner.invoke(
-        cli, ["meld", "makefiles", str(src), str(tmp_path / "nope.mk")]
-    )
-    assert result.exit_code != 0
+    result = runner.invoke(cli, ["meld", "makefiles", str(src), str(tgt), "-o", "json"])
+    assert result.exit_code == 0
+    data = json.loads(result.output)
+    assert data["new_variables"]["NEW_VAR"]["comments"] == [
+        "plain",
+        "indented",
+        "tabbed",
+    ]
+
+
+def test_parse_makefile_uses_pre_read_text(tmp_path: Path) -> None:
+    makefile = tmp_path / "Makefile"
+    makefile.write_text("A := 1\n")
+    assert parse_makefile(makefile).variables["A"].value == "1"
+    # Pre-read text wins over the file, which is not read again
+    assert parse_makefile(makefile, "A := 22\n").variables["A"].value == "22"
@@ -1,7 +1,9 @@
 """Shared test utilities."""
 
+import os
 import pathlib
-from collections.abc import Callable, Iterable
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from types import MappingProxyType
 
 from cookiecutter.main import cookiecutter
 
@@ -10,12 +12,13 @@ COOKBOOK_DIR = pathlib.Path(__file__).parent.parent / "cookbook"
 
 def paths(directory: pathlib.Path) -> set[str]:
     """Return a set of all relative paths (files and dirs) under *directory*."""
-    all_paths = list(directory.glob("**/*"))
-    return {
-        str(p.relative_to(directory))
-        for p in all_paths
-        if str(p.relative_to(directory)) != "."
-    }
+    prefix_len = len(str(directory)) + 1
+    found: set[str] = set()
+    for root, dirs, files in os.walk(directory):
+        rel = root[prefix_len:]
+        for name in (*dirs, *files):
+            found.add(os.path.join(rel, name) if rel else name)
+    return found
 
 
 def bake(
@@ -41,6 +44,15 @@ def bake(
     return pathlib.Path(result)
 
 
+def read_texts(baked: pathlib.Path, names: Iterable[str]) -> Mapping[str, str]:
+    """Read each of ``names`` (``/``-separated, relative to ``baked``) once.
+
+    Returns a read-only mapping from name to text, for class-scoped fixtures
+    shared by tests that assert on the same handful of files.
+    """
+    return MappingProxyType({name: (baked / name).read_text() for name in names})
+
+
 def makefile_recipe(makefile: str, target: str) -> str:
     """Return the recipe body for ``target:`` in ``makefile``.
 
@@ -80,6 +92,44 @@ def mermaid_block(markdown: str) -> str:
     return markdown[body_start:end]
 
 
+def _candidate_files(
+    baked: pathlib.Path,
+    suffixes: Iterable[str] | None,
+    extra_names: Iterable[str] = (),
+) -> Iterator[tuple[str, bytes]]:
+    """Yield ``(relative_path, raw_bytes)`` for each regular file under ``baked``.
+
+    ``suffixes`` / ``extra_names`` gate which files qualify, as described in
+    :func:`text_file_offenders`; ``None`` lets every file through. Paths stay
+    strings and contents stay bytes so callers can search without decoding.
+    """
+    suffix_set = set(suffixes) if suffixes is not None else None
+    name_set = set(extra_names)
+    prefix_len = len(str(baked)) + 1
+    for root, _dirs, files in os.walk(baked):
+        for name in files:
+            if (
+                suffix_set is not None
+                and pathlib.PurePath(name).suffix not in suffix_set
+                and name not in name_set
+            ):
+                continue
+            full = os.path.join(root, name)
+            if not os.path.isfile(full):
+                continue
+            with open(full, "rb") as f:
+                yield full[prefix_len:], f.read()
+
+
+def _is_text(data: bytes) -> bool:
+    """The binary-skip guard: a file counts as text if it decodes as UTF-8."""
+    try:
+        data.decode()
+    except UnicodeDecodeError:
+        return False
+    return True
+
+
 def text_file_offenders(
     baked: pathlib.Path,
     suffixes: Iterable[str] | None,
@@ -97,24 +147,14 @@ def text_file_offenders(
     is the binary-skip guard. Returned paths are relative to ``baked``
     for legible failure messages.
     """
-    suffix_set = set(suffixes) if suffixes is not None else None
-    name_set = set(extra_names)
     offenders: list[pathlib.Path] = []
-    for path in baked.rglob("*"):
-        if not path.is_file():
-            continue
-        if (
-            suffix_set is not None
-            and path.suffix not in suffix_set
-            and path.name not in name_set
-        ):
-            continue
+    for rel, data in _candidate_files(baked, suffixes, extra_names):
         try:
-            text = path.read_text()
+            text = data.decode()
         except UnicodeDecodeError:
             continue
         if predicate(text):
-            offenders.append(path.relative_to(baked))
+            offenders.append(pathlib.Path(rel))
     return offenders
 
 
@@ -132,27 +172,15 @@ def find_default_leaks(
     by the override, and a leak is a hardcoded substring that escaped
     Jinja substitution. Filtering matches :func:`text_file_offenders` —
     pass ``suffixes=None`` to scan every text file with no suffix gate.
+    Contents are searched as bytes; only files with a hit are decoded, to
+    apply the binary-skip guard.
     """
-    default_list = list(defaults)
-    suffix_set = set(suffixes) if suffixes is not None else None
-    name_set = set(extra_names)
+    encoded = [(default, default.encode()) for default in defaults]
     leaks: list[tuple[pathlib.Path, str]] = []
-    for path in baked.rglob("*"):
-        if not path.is_file():
-            continue
-        if (
-            suffix_set is not None
-            and path.suffix not in suffix_set
-            and path.name not in name_set
-        ):
-            continue
-        try:
-            text = path.read_text()
-        except UnicodeDecodeError:
-            continue
-        for default in default_list:
-            if default in text:
-                leaks.append((path.relative_to(baked), default))
+    for rel, data in _candidate_files(baked, suffixes, extra_names):
+        hits = [default for default, needle in encoded if needle in data]
+        if hits and _is_text(data):
+            leaks.extend((pathlib.Path(rel), default) for default in hits)
     return leaks
 
 
@@ -172,21 +200,17 @@ def find_jinja_leaks(
     that look like braces, etc.).
 
     No suffix filter is applied — Jinja escapes can land in any text file,
-    and binary files are skipped via the UnicodeDecodeError guard.
+    and binary files are skipped via the UTF-8 decode guard, which only runs
+    on files whose bytes contain a token.
     """
     offenders: list[pathlib.Path] = []
-    for path in baked.rglob("*"):
-        if not path.is_file():
-            continue
-        try:
-            text = path.read_text()
-        except UnicodeDecodeError:
-            continue
+    for rel, data in _candidate_files(baked, None):
         if require_cookiecutter:
-            if "{{" in text and "cookiecutter." in text:
-                offenders.append(path.relative_to(baked))
-        elif "{{" in text or "}}" in text:
-            offenders.append(path.relative_to(baked))
+            flagged = b"{{" in data and b"cookiecutter." in data
+        else:
+            flagged = b"{{" in data or b"}}" in data
+        if flagged and _is_text(data):
+            offenders.append(pathlib.Path(rel))
     return offenders
 
 
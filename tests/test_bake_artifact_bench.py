@@ -9,6 +9,7 @@ import json
 import pathlib
 import shutil
 import subprocess
+from collections.abc import Mapping
 
 import pytest
 
@@ -17,6 +18,7 @@ from tests.helpers import (
     find_default_leaks,
     find_jinja_leaks,
     mermaid_block,
+    read_texts,
     readme_section,
 )
 
@@ -477,104 +479,114 @@ class TestBakeWithWorkflow:
             extra_context={"include_github_workflows": "yes"},
         )
 
+    @pytest.fixture(scope="class")
+    def texts(self, baked: pathlib.Path) -> Mapping[str, str]:
+        return read_texts(baked, (".github/workflows/ci.yml", "Makefile", "README.md"))
+
     # ---- ci.yml shape ----
 
     def test_ci_workflow_file_exists(self, baked: pathlib.Path) -> None:
         assert (baked / ".github" / "workflows" / "ci.yml").is_file()
 
-    def test_ci_workflow_defines_verify_job(self, baked: pathlib.Path) -> None:
+    def test_ci_workflow_defines_verify_job(self, texts: Mapping[str, str]) -> None:
         """v1.1 ships a single verify job. The e2e job returns in v1.2 via rodney."""
-        yml = (baked / ".github" / "workflows" / "ci.yml").read_text()
+        yml = texts[".github/workflows/ci.yml"]
         assert "verify:" in yml
 
-    def test_ci_workflow_has_no_e2e_job(self, baked: pathlib.Path) -> None:
+    def test_ci_workflow_has_no_e2e_job(self, texts: Mapping[str, str]) -> None:
         """Playwright is descoped for v1.1; no job line should mention e2e."""
-        yml = (baked / ".github" / "workflows" / "ci.yml").read_text()
+        yml = texts[".github/workflows/ci.yml"]
         assert "e2e:" not in yml
 
     def test_ci_workflow_triggers_include_pull_request(
-        self, baked: pathlib.Path
+        self, texts: Mapping[str, str]
     ) -> None:
-        yml = (baked / ".github" / "workflows" / "ci.yml").read_text()
+        yml = texts[".github/workflows/ci.yml"]
         assert "pull_request:" in yml
 
     def test_ci_workflow_triggers_include_push_to_main(
-        self, baked: pathlib.Path
+        self, texts: Mapping[str, str]
     ) -> None:
-        yml = (baked / ".github" / "workflows" / "ci.yml").read_text()
+        yml = texts[".github/workflows/ci.yml"]
         assert "push:" in yml
         assert "main" in yml
 
     def test_ci_workflow_has_no_label_or_dispatch_triggers(
-        self, baked: pathlib.Path
+        self, texts: Mapping[str, str]
     ) -> None:
         """workflow_dispatch and the run-e2e label gated the descoped e2e job; without e2e, neither is needed."""
-        yml = (baked / ".github" / "workflows" / "ci.yml").read_text()
+        yml = texts[".github/workflows/ci.yml"]
         assert "workflow_dispatch" not in yml
         assert "run-e2e" not in yml
 
-    def test_ci_verify_job_invokes_npm_ci(self, baked: pathlib.Path) -> None:
-        yml = (baked / ".github" / "workflows" / "ci.yml").read_text()
+    def test_ci_verify_job_invokes_npm_ci(self, texts: Mapping[str, str]) -> None:
+        yml = texts[".github/workflows/ci.yml"]
         assert "npm ci" in yml
 
-    def test_ci_verify_job_invokes_make_verify(self, baked: pathlib.Path) -> None:
-        yml = (baked / ".github" / "workflows" / "ci.yml").read_text()
+    def test_ci_verify_job_invokes_make_verify(self, texts: Mapping[str, str]) -> None:
+        yml = texts[".github/workflows/ci.yml"]
         assert "make verify" in yml
 
-    def test_ci_verify_job_invokes_make_test_unit(self, baked: pathlib.Path) -> None:
-        yml = (baked / ".github" / "workflows" / "ci.yml").read_text()
+    def test_ci_verify_job_invokes_make_test_unit(
+        self, texts: Mapping[str, str]
+    ) -> None:
+        yml = texts[".github/workflows/ci.yml"]
         assert "make test-unit" in yml
 
     # ---- Makefile ----
 
     def test_makefile_has_no_setup_ci_or_test_e2e_targets(
-        self, baked: pathlib.Path
+        self, texts: Mapping[str, str]
     ) -> None:
         """Both descoped alongside playwright for v1.1. They return in v1.2."""
-        makefile = (baked / "Makefile").read_text()
+        makefile = texts["Makefile"]
         assert "setup-ci:" not in makefile
         assert "test-e2e:" not in makefile
 
-    def test_makefile_install_target_present(self, baked: pathlib.Path) -> None:
+    def test_makefile_install_target_present(self, texts: Mapping[str, str]) -> None:
         """install is the local-dev affordance — survives the playwright descope."""
-        makefile = (baked / "Makefile").read_text()
+        makefile = texts["Makefile"]
         assert "install:" in makefile
 
     # ---- README CI section ----
 
-    def test_readme_has_ci_section(self, baked: pathlib.Path) -> None:
-        readme = (baked / "README.md").read_text()
+    def test_readme_has_ci_section(self, texts: Mapping[str, str]) -> None:
+        readme = texts["README.md"]
         assert "## CI" in readme
 
-    def test_readme_ci_section_names_workflow_file(self, baked: pathlib.Path) -> None:
-        readme = (baked / "README.md").read_text()
+    def test_readme_ci_section_names_workflow_file(
+        self, texts: Mapping[str, str]
+    ) -> None:
+        readme = texts["README.md"]
         assert ".github/workflows/ci.yml" in readme
 
-    def test_readme_ci_section_names_verify_job(self, baked: pathlib.Path) -> None:
+    def test_readme_ci_section_names_verify_job(self, texts: Mapping[str, str]) -> None:
         """Scoped to the ## CI section so incidental 'verify' mentions elsewhere
         don't hide a regression in the CI docs themselves."""
-        readme = (baked / "README.md").read_text()
+        readme = texts["README.md"]
         assert "verify" in readme_section(readme, "CI").lower()
 
     def test_readme_ci_section_flags_e2e_deferred_to_v1_2(
-        self, baked: pathlib.Path
+        self, texts: Mapping[str, str]
     ) -> None:
         """A puncher must see that browser-level e2e is intentional future work,
         not a forgotten gap."""
-        readme = (baked / "README.md").read_text()
+        readme = texts["README.md"]
         assert "rodney" in readme_section(readme, "CI").lower()
 
-    def test_readme_ci_section_has_mermaid_flowchart(self, baked: pathlib.Path) -> None:
-        readme = (baked / "README.md").read_text()
+    def test_readme_ci_section_has_mermaid_flowchart(
+        self, texts: Mapping[str, str]
+    ) -> None:
+        readme = texts["README.md"]
         assert "```mermaid" in readme
         assert "flowchart" in readme
 
     def test_readme_mermaid_names_verify_make_targets(
-        self, baked: pathlib.Path
+        self, texts: Mapping[str, str]
     ) -> None:
         """Propagation: the flowchart must name every make target the workflow invokes.
         If ci.yml adds or renames a target, the flowchart must track it."""
-        readme = (baked / "README.md").read_text()
+        readme = texts["README.md"]
         mermaid = mermaid_block(readme)
         assert "make verify" in mermaid
         assert "make test-unit" in mermaid
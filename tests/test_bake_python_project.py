@@ -7,7 +7,9 @@ trees and file contents.
 
 import os
 import pathlib
+import shutil
 import subprocess
+from collections.abc import Mapping
 
 import pytest
 
@@ -18,15 +20,38 @@ from tests.helpers import (
     makefile_recipe,
     mermaid_block,
     paths,
+    read_texts,
 )
 
 
+@pytest.fixture(scope="module")
+def default_bake(tmp_path_factory: pytest.TempPathFactory) -> pathlib.Path:
+    """python-project baked once with defaults for the whole module.
+
+    Read-only: tests that modify a baked tree copy it first.
+    """
+    return bake("python-project", tmp_path_factory.mktemp("defaults"))
+
+
 class TestBakeDefaults:
     """Bake with default context values from cookiecutter.json."""
 
     @pytest.fixture(scope="class")
-    def baked(self, tmp_path_factory: pytest.TempPathFactory) -> pathlib.Path:
-        return bake("python-project", tmp_path_factory.mktemp("defaults"))
+    def baked(self, default_bake: pathlib.Path) -> pathlib.Path:
+        return default_bake
+
+    @pytest.fixture(scope="class")
+    def texts(self, baked: pathlib.Path) -> Mapping[str, str]:
+        return read_texts(
+            baked,
+            (
+                "pyproject.toml",
+                "Makefile",
+                "README.md",
+                "tests/test_main.py",
+                "fresh_project/main.py",
+            ),
+        )
 
     def test_output_directory_exists(self, baked: pathlib.Path) -> None:
         assert baked.is_dir()
@@ -41,90 +66,74 @@ class TestBakeDefaults:
     def test_main_module_exists(self, baked: pathlib.Path) -> None:
         assert (baked / "fresh_project" / "main.py").is_file()
 
-    def test_main_module_has_hello_world(self, baked: pathlib.Path) -> None:
-        main_py = (baked / "fresh_project" / "main.py").read_text()
+    def test_main_module_has_hello_world(self, texts: Mapping[str, str]) -> None:
+        main_py = texts["fresh_project/main.py"]
         assert "def hello_world()" in main_py
 
-    def test_main_module_has_main(self, baked: pathlib.Path) -> None:
-        main_py = (baked / "fresh_project" / "main.py").read_text()
+    def test_main_module_has_main(self, texts: Mapping[str, str]) -> None:
+        main_py = texts["fresh_project/main.py"]
         assert "def main()" in main_py
 
     def test_test_file_exists(self, baked: pathlib.Path) -> None:
         assert (baked / "tests" / "test_main.py").is_file()
 
-    def test_test_imports_package(self, baked: pathlib.Path) -> None:
-        test_py = (baked / "tests" / "test_main.py").read_text()
+    def test_test_imports_package(self, texts: Mapping[str, str]) -> None:
+        test_py = texts["tests/test_main.py"]
         assert "from fresh_project.main import hello_world" in test_py
 
-    def test_test_has_return_annotation(self, baked: pathlib.Path) -> None:
+    def test_test_has_return_annotation(self, texts: Mapping[str, str]) -> None:
         """Test functions must have -> None for strict mypy."""
-        test_py = (baked / "tests" / "test_main.py").read_text()
+        test_py = texts["tests/test_main.py"]
         assert "-> None:" in test_py
 
-    def test_pyproject_name(self, baked: pathlib.Path) -> None:
-        pyproject = (baked / "pyproject.toml").read_text()
-        assert 'name = "fresh-project"' in pyproject
-
-    def test_pyproject_description(self, baked: pathlib.Path) -> None:
-        pyproject = (baked / "pyproject.toml").read_text()
-        assert 'description = "My take on Fresh Project"' in pyproject
-
-    def test_pyproject_python_version(self, baked: pathlib.Path) -> None:
-        pyproject = (baked / "pyproject.toml").read_text()
-        assert 'requires-python = ">=3.13"' in pyproject
-
-    def test_pyproject_hatchling_backend(self, baked: pathlib.Path) -> None:
-        pyproject = (baked / "pyproject.toml").read_text()
-        assert 'build-backend = "hatchling.build"' in pyproject
-
-    def test_pyproject_click_dependency(self, baked: pathlib.Path) -> None:
-        pyproject = (baked / "pyproject.toml").read_text()
-        assert '"click"' in pyproject
-
-    def test_pyproject_pydantic_dependency(self, baked: pathlib.Path) -> None:
-        pyproject = (baked / "pyproject.toml").read_text()
-        assert '"pydantic"' in pyproject
-
-    def test_pyproject_mypy_strict(self, baked: pathlib.Path) -> None:
-        pyproject = (baked / "pyproject.toml").read_text()
-        assert "disallow_untyped_defs = true" in pyproject
-
-    def test_pyproject_mypy_overrides_package(self, baked: pathlib.Path) -> None:
-        pyproject = (baked / "pyproject.toml").read_text()
-        assert 'module = "fresh_project.*"' in pyproject
-
-    def test_readme_heading(self, baked: pathlib.Path) -> None:
-        readme = (baked / "README.md").read_text()
+    @pytest.mark.parametrize(
+        "needle",
+        [
+            'name = "fresh-project"',
+            'description = "My take on Fresh Project"',
+            'requires-python = ">=3.13"',
+            'build-backend = "hatchling.build"',
+            '"click"',
+            '"pydantic"',
+            "disallow_untyped_defs = true",
+            'module = "fresh_project.*"',
+        ],
+    )
+    def test_pyproject_contains(self, texts: Mapping[str, str], needle: str) -> None:
+        assert needle in texts["pyproject.toml"]
+
+    def test_readme_heading(self, texts: Mapping[str, str]) -> None:
+        readme = texts["README.md"]
         assert readme.startswith("# fresh_project")
 
-    def test_readme_has_quickstart(self, baked: pathlib.Path) -> None:
-        readme = (baked / "README.md").read_text()
+    def test_readme_has_quickstart(self, texts: Mapping[str, str]) -> None:
+        readme = texts["README.md"]
         assert "uv sync && direnv allow" in readme
 
     def test_makefile_exists(self, baked: pathlib.Path) -> None:
         assert (baked / "Makefile").is_file()
 
-    def test_makefile_test_target(self, baked: pathlib.Path) -> None:
-        makefile = (baked / "Makefile").read_text()
+    def test_makefile_test_target(self, texts: Mapping[str, str]) -> None:
+        makefile = texts["Makefile"]
         assert "--cov=fresh_project" in makefile
-        assert "$(PYTHON_DIRS)" in makefile.split("test:")[1].split("\n\n")[0]
+        assert "$(PYTHON_DIRS)" in makefile_recipe(makefile, "test")
 
-    def test_makefile_python_dirs(self, baked: pathlib.Path) -> None:
-        makefile = (baked / "Makefile").read_text()
+    def test_makefile_python_dirs(self, texts: Mapping[str, str]) -> None:
+        makefile = texts["Makefile"]
         assert "PYTHON_DIRS = fresh_project/ tests/" in makefile
 
-    def test_makefile_dist_target(self, baked: pathlib.Path) -> None:
-        makefile = (baked / "Makefile").read_text()
+    def test_makefile_dist_target(self, texts: Mapping[str, str]) -> None:
+        makefile = texts["Makefile"]
         assert "dist: test" in makefile
         assert "uv build --out-dir dist/" in makefile
 
-    def test_makefile_dist_help_entry(self, baked: pathlib.Path) -> None:
-        makefile = (baked / "Makefile").read_text()
+    def test_makefile_dist_help_entry(self, texts: Mapping[str, str]) -> None:
+        makefile = texts["Makefile"]
         assert '"dist"' in makefile
         assert "Prepare a versioned release" in makefile
 
-    def test_makefile_dist_is_phony(self, baked: pathlib.Path) -> None:
-        makefile = (baked / "Makefile").read_text()
+    def test_makefile_dist_is_phony(self, texts: Mapping[str, str]) -> None:
+        makefile = texts["Makefile"]
         phony_line = [
             line for line in makefile.splitlines() if line.startswith(".PHONY:")
         ][0]
@@ -147,22 +156,25 @@ class TestBakeDefaults:
 
     def test_full_file_tree(self, baked: pathlib.Path) -> None:
         tree = paths(baked)
-        assert "fresh_project" in tree
-        assert "fresh_project/__init__.py" in tree
-        assert "fresh_project/main.py" in tree
-        assert "tests" in tree
-        assert "tests/test_main.py" in tree
-        assert "docs" in tree
-        assert "docs/spec.md" in tree
-        assert "scripts" in tree
-        assert "pyproject.toml" in tree
-        assert "README.md" in tree
-        assert "Makefile" in tree
-        assert ".envrc" in tree
-        assert ".gitattributes" in tree
-        assert ".gitignore" in tree
-        assert "AGENTS.md" in tree
-        assert "CLAUDE.md" in tree
+        missing = {
+            "fresh_project",
+            "fresh_project/__init__.py",
+            "fresh_project/main.py",
+            "tests",
+            "tests/test_main.py",
+            "docs",
+            "docs/spec.md",
+            "scripts",
+            "pyproject.toml",
+            "README.md",
+            "Makefile",
+            ".envrc",
+            ".gitattributes",
+            ".gitignore",
+            "AGENTS.md",
+            "CLAUDE.md",
+        } - tree
+        assert not missing, f"missing from the baked tree: {sorted(missing)}"
 
     def test_no_raw_template_variables(self, baked: pathlib.Path) -> None:
         """No file should contain un-rendered cookiecutter variables."""
@@ -200,8 +212,10 @@ class TestMakeDistValidation:
         )
 
     @pytest.fixture()
-    def baked(self, tmp_path: pathlib.Path) -> pathlib.Path:
-        project = bake("python-project", tmp_path)
+    def baked(self, default_bake: pathlib.Path, tmp_path: pathlib.Path) -> pathlib.Path:
+        # Each test commits into the repo, so it gets its own copy of the bake.
+        project = tmp_path / default_bake.name
+        shutil.copytree(default_bake, project, symlinks=True)
         # Initialise a git repo so the dist guards can run.
         self._git("init", cwd=project)
         self._git("add", ".", cwd=project)
@@ -264,6 +278,12 @@ class TestBakeCustomContext:
             },
         )
 
+    @pytest.fixture(scope="class")
+    def texts(self, baked: pathlib.Path) -> Mapping[str, str]:
+        return read_texts(
+            baked, ("pyproject.toml", "Makefile", "README.md", "tests/test_main.py")
+        )
+
     def test_output_directory_named_by_slug(self, baked: pathlib.Path) -> None:
         assert baked.is_dir()
 
@@ -272,28 +292,32 @@ class TestBakeCustomContext:
         assert (baked / "widget_factory" / "__init__.py").is_file()
         assert (baked / "widget_factory" / "main.py").is_file()
 
-    def test_pyproject_uses_custom_slug(self, baked: pathlib.Path) -> None:
-        pyproject = (baked / "pyproject.toml").read_text()
+    def test_pyproject_uses_custom_slug(self, texts: Mapping[str, str]) -> None:
+        pyproject = texts["pyproject.toml"]
         assert 'name = "widget-factory"' in pyproject
 
-    def test_pyproject_uses_custom_name(self, baked: pathlib.Path) -> None:
-        pyproject = (baked / "pyproject.toml").read_text()
+    def test_pyproject_uses_custom_name(self, texts: Mapping[str, str]) -> None:
+        pyproject = texts["pyproject.toml"]
         assert 'description = "My take on Widget Factory"' in pyproject
 
-    def test_pyproject_mypy_overrides_custom_package(self, baked: pathlib.Path) -> None:
-        pyproject = (baked / "pyproject.toml").read_text()
+    def test_pyproject_mypy_overrides_custom_package(
+        self, texts: Mapping[str, str]
+    ) -> None:
+        pyproject = texts["pyproject.toml"]
         assert 'module = "widget_factory.*"' in pyproject
 
-    def test_test_imports_custom_package(self, baked: pathlib.Path) -> None:
-        test_py = (baked / "tests" / "test_main.py").read_text()
+    def test_test_imports_custom_package(self, texts: Mapping[str, str]) -> None:
+        test_py = texts["tests/test_main.py"]
         assert "from widget_factory.main import hello_world" in test_py
 
-    def test_makefile_coverage_uses_custom_package(self, baked: pathlib.Path) -> None:
-        makefile = (baked / "Makefile").read_text()
+    def test_makefile_coverage_uses_custom_package(
+        self, texts: Mapping[str, str]
+    ) -> None:
+        makefile = texts["Makefile"]
         assert "--cov=widget_factory" in makefile
 
-    def test_readme_heading_uses_custom_package(self, baked: pathlib.Path) -> None:
-        readme = (baked / "README.md").read_text()
+    def test_readme_heading_uses_custom_package(self, texts: Mapping[str, str]) -> None:
+        readme = texts["README.md"]
         assert readme.startswith("# widget_factory")
 
     def test_no_default_values_leak(self, baked: pathlib.Path) -> None:
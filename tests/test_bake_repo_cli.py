@@ -7,6 +7,7 @@ resulting file trees and file contents.
 
 import pathlib
 import subprocess
+from collections.abc import Callable, Mapping
 
 import pytest
 
@@ -16,6 +17,7 @@ from tests.helpers import (
     makefile_recipe,
     mermaid_block,
     paths,
+    read_texts,
 )
 
 
@@ -36,91 +38,102 @@ def _bake(tmp_path: pathlib.Path, *, workflow: str) -> pathlib.Path:
 # ---------------------------------------------------------------------------
 
 
-@pytest.fixture(scope="module", params=["yes", "no"])
-def baked(
-    request: pytest.FixtureRequest, tmp_path_factory: pytest.TempPathFactory
-) -> pathlib.Path:
-    return _bake(tmp_path_factory.mktemp("shared"), workflow=request.param)
-
-
-def test_output_directory_exists(baked: pathlib.Path) -> None:
-    assert baked.is_dir()
-
-
-def test_template_module_exists(baked: pathlib.Path) -> None:
-    assert (baked / "demo_repo_cli" / "tui" / "template.py").is_file()
-
+@pytest.fixture(scope="module")
+def bake_for(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> Callable[[str], pathlib.Path]:
+    """Return a lookup that bakes each workflow value once per module.
 
-def test_template_tests_exist(baked: pathlib.Path) -> None:
-    assert (baked / "tests" / "test_template.py").is_file()
-    assert (baked / "tests" / "test_template_apply.py").is_file()
-    assert (baked / "tests" / "test_template_prepare.py").is_file()
+    The shared tests and the workflow-specific classes all read the same two
+    trees, so none of them may modify a baked project.
+    """
+    baked_by_workflow: dict[str, pathlib.Path] = {}
 
+    def _get(workflow: str) -> pathlib.Path:
+        if workflow not in baked_by_workflow:
+            baked_by_workflow[workflow] = _bake(
+                tmp_path_factory.mktemp(f"workflow-{workflow}"), workflow=workflow
+            )
+        return baked_by_workflow[workflow]
 
-def test_readme_contains_placeholder(baked: pathlib.Path) -> None:
-    readme = (baked / "README.md").read_text()
-    assert "<template placeholder>" in readme
-
-
-def test_readme_heading(baked: pathlib.Path) -> None:
-    readme = (baked / "README.md").read_text()
-    assert readme.startswith("# Demo Repo CLI")
-
+    return _get
 
-def test_requirements_txt_exists(baked: pathlib.Path) -> None:
-    assert (baked / "requirements.txt").is_file()
 
+@pytest.fixture(scope="module")
+def tree_of() -> Callable[[pathlib.Path], frozenset[str]]:
+    """Return a lookup that walks each baked tree once per module."""
+    tree_by_bake: dict[pathlib.Path, frozenset[str]] = {}
 
-def test_cli_imports_template(baked: pathlib.Path) -> None:
-    cli_py = (baked / "demo_repo_cli" / "tui" / "cli.py").read_text()
-    assert "from demo_repo_cli.tui.template import template" in cli_py
-    assert "cli.add_command(template)" in cli_py
+    def _get(baked: pathlib.Path) -> frozenset[str]:
+        if baked not in tree_by_bake:
+            tree_by_bake[baked] = frozenset(paths(baked))
+        return tree_by_bake[baked]
 
+    return _get
 
-def test_status_module_exists(baked: pathlib.Path) -> None:
-    assert (baked / "demo_repo_cli" / "tui" / "status.py").is_file()
 
-
-def test_dashboard_module_exists(baked: pathlib.Path) -> None:
-    assert (baked / "demo_repo_cli" / "tui" / "dashboard.py").is_file()
+@pytest.fixture(scope="module", params=["yes", "no"])
+def baked(
+    request: pytest.FixtureRequest, bake_for: Callable[[str], pathlib.Path]
+) -> pathlib.Path:
+    return bake_for(request.param)
 
 
-def test_status_tests_exist(baked: pathlib.Path) -> None:
-    assert (baked / "tests" / "test_status.py").is_file()
+@pytest.fixture(scope="module")
+def texts(baked: pathlib.Path) -> Mapping[str, str]:
+    return read_texts(
+        baked, ("README.md", "demo_repo_cli/tui/cli.py", "pyproject.toml")
+    )
 
 
-def test_dashboard_tests_exist(baked: pathlib.Path) -> None:
-    assert (baked / "tests" / "test_dashboard.py").is_file()
+def test_output_directory_exists(baked: pathlib.Path) -> None:
+    assert baked.is_dir()
 
 
-def test_cli_imports_status(baked: pathlib.Path) -> None:
-    cli_py = (baked / "demo_repo_cli" / "tui" / "cli.py").read_text()
-    assert "from demo_repo_cli.tui.status import status" in cli_py
-    assert "cli.add_command(status)" in cli_py
+@pytest.mark.parametrize(
+    "relpath",
+    [
+        "demo_repo_cli/tui/__init__.py",
+        "demo_repo_cli/tui/cli.py",
+        "demo_repo_cli/tui/template.py",
+        "demo_repo_cli/tui/status.py",
+        "demo_repo_cli/tui/dashboard.py",
+        "demo_repo_cli/AGENTS.md",
+        "tests/test_template.py",
+        "tests/test_template_apply.py",
+        "tests/test_template_prepare.py",
+        "tests/test_status.py",
+        "tests/test_dashboard.py",
+        "pyproject.toml",
+        "README.md",
+        "requirements.txt",
+    ],
+)
+def test_file_exists(baked: pathlib.Path, relpath: str) -> None:
+    assert (baked / relpath).is_file()
 
 
-def test_cli_imports_dashboard(baked: pathlib.Path) -> None:
-    cli_py = (baked / "demo_repo_cli" / "tui" / "cli.py").read_text()
-    assert "from demo_repo_cli.tui.dashboard import dashboard" in cli_py
-    assert "cli.add_command(dashboard)" in cli_py
+def test_readme_contains_placeholder(texts: Mapping[str, str]) -> None:
+    readme = texts["README.md"]
+    assert "<template placeholder>" in readme
 
 
-def test_pyproject_rich_dev_dependency(baked: pathlib.Path) -> None:
-    pyproject = (baked / "pyproject.toml").read_text()
-    assert '"rich"' in pyproject
+def test_readme_heading(texts: Mapping[str, str]) -> None:
+    readme = texts["README.md"]
+    assert readme.startswith("# Demo Repo CLI")
 
 
-def test_pyproject_textual_dev_dependency(baked: pathlib.Path) -> None:
-    pyproject = (baked / "pyproject.toml").read_text()
-    assert '"textual"' in pyproject
+@pytest.mark.parametrize("command", ["template", "status", "dashboard"])
+def test_cli_registers_command(texts: Mapping[str, str], command: str) -> None:
+    cli_py = texts["demo_repo_cli/tui/cli.py"]
+    assert f"from demo_repo_cli.tui.{command} import {command}" in cli_py
+    assert f"cli.add_command({command})" in cli_py
 
 
-def test_core_files_exist(baked: pathlib.Path) -> None:
-    assert (baked / "demo_repo_cli" / "tui" / "__init__.py").is_file()
-    assert (baked / "demo_repo_cli" / "tui" / "cli.py").is_file()
-    assert (baked / "pyproject.toml").is_file()
-    assert (baked / "README.md").is_file()
-    assert (baked / "demo_repo_cli" / "AGENTS.md").is_file()
+@pytest.mark.parametrize("package", ["rich", "textual"])
+def test_pyproject_dev_dependency(texts: Mapping[str, str], package: str) -> None:
+    pyproject = texts["pyproject.toml"]
+    assert f'"{package}"' in pyproject
 
 
 def test_no_raw_template_variables(baked: pathlib.Path) -> None:
@@ -130,7 +143,7 @@ def test_no_raw_template_variables(baked: pathlib.Path) -> None:
 
 
 def test_cli_defines_ordered_group_with_alphabetical_override(
-    baked: pathlib.Path,
+    texts: Mapping[str, str],
 ) -> None:
     """The CLI's signature behaviour: subcommand listings sort
     alphabetically regardless of registration order. The notes call
@@ -145,7 +158,7 @@ def test_cli_defines_ordered_group_with_alphabetical_override(
        call (the one-line idiom is what makes the property a property).
     3. The Click group is wired with `cls=OrderedGroup` (otherwise the
        override never fires)."""
-    cli_py = (baked / "demo_repo_cli" / "tui" / "cli.py").read_text()
+    cli_py = texts["demo_repo_cli/tui/cli.py"]
     assert "class OrderedGroup(click.Group):" in cli_py, (
         "cli.py must define `class OrderedGroup(click.Group)` — the "
         "alphabetical-listing seam"
@@ -206,32 +219,39 @@ def test_baked_agents_md_documents_cli_scope_and_standards(
     )
 
 
-def test_shared_file_tree(baked: pathlib.Path) -> None:
+def test_shared_file_tree(
+    baked: pathlib.Path, tree_of: Callable[[pathlib.Path], frozenset[str]]
+) -> None:
     """Core files present regardless of workflow setting."""
-    tree = paths(baked)
-    assert "demo_repo_cli" in tree
-    assert "demo_repo_cli/tui" in tree
-    assert "demo_repo_cli/tui/__init__.py" in tree
-    assert "demo_repo_cli/tui/cli.py" in tree
-    assert "demo_repo_cli/tui/dashboard.py" in tree
-    assert "demo_repo_cli/tui/status.py" in tree
-    assert "demo_repo_cli/tui/template.py" in tree
-    assert "tests" in tree
-    assert "tests/test_cli.py" in tree
-    assert "tests/test_dashboard.py" in tree
-    assert "tests/test_status.py" in tree
-    assert "tests/test_template.py" in tree
-    assert "tests/test_template_apply.py" in tree
-    assert "tests/test_template_prepare.py" in tree
-    assert "README.md" in tree
-    assert "demo_repo_cli/AGENTS.md" in tree
+    tree = tree_of(baked)
+    missing = {
+        "demo_repo_cli",
+        "demo_repo_cli/tui",
+        "demo_repo_cli/tui/__init__.py",
+        "demo_repo_cli/tui/cli.py",
+        "demo_repo_cli/tui/dashboard.py",
+        "demo_repo_cli/tui/dashboard_app.py",
+        "demo_repo_cli/tui/status.py",
+        "demo_repo_cli/tui/template.py",
+        "tests",
+        "tests/conftest.py",
+        "tests/test_cli.py",
+        "tests/test_dashboard.py",
+        "tests/test_status.py",
+        "tests/test_template.py",
+        "tests/test_template_apply.py",
+        "tests/test_template_prepare.py",
+        "README.md",
+        "demo_repo_cli/AGENTS.md",
+        "pyproject.toml",
+        "requirements.txt",
+        ".envrc",
+        ".gitattributes",
+        "CHANGELOG.md",
+        "Makefile",
+    } - tree
+    assert not missing, f"missing from the baked tree: {sorted(missing)}"
     assert "CLAUDE.md" not in tree
-    assert "pyproject.toml" in tree
-    assert "requirements.txt" in tree
-    assert ".envrc" in tree
-    assert ".gitattributes" in tree
-    assert "CHANGELOG.md" in tree
-    assert "Makefile" in tree
 
 
 # ---------------------------------------------------------------------------
@@ -243,8 +263,12 @@ class TestBakeWithWorkflow:
     """Tests specific to include_github_workflows='yes'."""
 
     @pytest.fixture(scope="class")
-    def baked(self, tmp_path_factory: pytest.TempPathFactory) -> pathlib.Path:
-        return _bake(tmp_path_factory.mktemp("workflow"), workflow="yes")
+    def baked(self, bake_for: Callable[[str], pathlib.Path]) -> pathlib.Path:
+        return bake_for("yes")
+
+    @pytest.fixture(scope="class")
+    def texts(self, baked: pathlib.Path) -> Mapping[str, str]:
+        return read_texts(baked, ("Makefile", "README.md", ".github/workflows/ci.yml"))
 
     def test_github_workflow_exists(self, baked: pathlib.Path) -> None:
         assert (baked / ".github" / "workflows" / "update-readme.yml").is_file()
@@ -259,8 +283,12 @@ class TestBakeWithWorkflow:
         assert "demo-repo template prepare" in workflow
         assert "demo-repo template apply" in workflow
 
-    def test_full_file_tree_includes_github(self, baked: pathlib.Path) -> None:
-        tree = paths(baked)
+    def test_full_file_tree_includes_github(
+        self,
+        baked: pathlib.Path,
+        tree_of: Callable[[pathlib.Path], frozenset[str]],
+    ) -> None:
+        tree = tree_of(baked)
         assert ".github" in tree
         assert ".github/workflows" in tree
         assert ".github/workflows/update-readme.yml" in tree
@@ -269,63 +297,71 @@ class TestBakeWithWorkflow:
         """ci.yml ships alongside update-readme.yml when the flag is 'yes'."""
         assert (baked / ".github" / "workflows" / "ci.yml").is_file()
 
-    def test_ci_workflow_invokes_make_setup_ci(self, baked: pathlib.Path) -> None:
+    def test_ci_workflow_invokes_make_setup_ci(self, texts: Mapping[str, str]) -> None:
         """Propagation: ci.yml routes install through make setup-ci."""
-        yml = (baked / ".github" / "workflows" / "ci.yml").read_text()
+        yml = texts[".github/workflows/ci.yml"]
         assert "make setup-ci" in yml
 
-    def test_ci_workflow_invokes_make_test(self, baked: pathlib.Path) -> None:
+    def test_ci_workflow_invokes_make_test(self, texts: Mapping[str, str]) -> None:
         """Propagation: renaming the Makefile test target would break CI."""
-        yml = (baked / ".github" / "workflows" / "ci.yml").read_text()
+        yml = texts[".github/workflows/ci.yml"]
         assert "make test" in yml
 
-    def test_makefile_defines_setup_ci_target(self, baked: pathlib.Path) -> None:
-        makefile = (baked / "Makefile").read_text()
+    def test_makefile_defines_setup_ci_target(self, texts: Mapping[str, str]) -> None:
+        makefile = texts["Makefile"]
         assert "setup-ci:" in makefile
 
-    def test_makefile_setup_ci_runs_uv_sync_frozen(self, baked: pathlib.Path) -> None:
+    def test_makefile_setup_ci_runs_uv_sync_frozen(
+        self, texts: Mapping[str, str]
+    ) -> None:
         """setup-ci uses --frozen to enforce lockfile fidelity in CI."""
-        makefile = (baked / "Makefile").read_text()
+        makefile = texts["Makefile"]
         assert "uv sync --frozen" in makefile_recipe(makefile, "setup-ci")
 
-    def test_makefile_setup_ci_is_phony(self, baked: pathlib.Path) -> None:
-        makefile = (baked / "Makefile").read_text()
+    def test_makefile_setup_ci_is_phony(self, texts: Mapping[str, str]) -> None:
+        makefile = texts["Makefile"]
         phony_line = next(
             line for line in makefile.splitlines() if line.startswith(".PHONY:")
         )
         assert "setup-ci" in phony_line
 
-    def test_makefile_help_lists_setup_ci(self, baked: pathlib.Path) -> None:
+    def test_makefile_help_lists_setup_ci(self, texts: Mapping[str, str]) -> None:
         """Propagation: make help must advertise the new target."""
-        makefile = (baked / "Makefile").read_text()
+        makefile = texts["Makefile"]
         assert '"setup-ci"' in makefile
 
-    def test_readme_has_ci_section(self, baked: pathlib.Path) -> None:
-        readme = (baked / "README.md").read_text()
+    def test_readme_has_ci_section(self, texts: Mapping[str, str]) -> None:
+        readme = texts["README.md"]
         assert "## CI" in readme
 
-    def test_readme_ci_section_names_both_workflows(self, baked: pathlib.Path) -> None:
+    def test_readme_ci_section_names_both_workflows(
+        self, texts: Mapping[str, str]
+    ) -> None:
         """Propagation: README must name both workflow files the flag ships."""
-        readme = (baked / "README.md").read_text()
+        readme = texts["README.md"]
         assert "update-readme.yml" in readme
         assert "ci.yml" in readme
 
-    def test_readme_ci_section_names_setup_ci_target(self, baked: pathlib.Path) -> None:
-        readme = (baked / "README.md").read_text()
+    def test_readme_ci_section_names_setup_ci_target(
+        self, texts: Mapping[str, str]
+    ) -> None:
+        readme = texts["README.md"]
         assert "make setup-ci" in readme
 
-    def test_readme_ci_section_has_mermaid_flowchart(self, baked: pathlib.Path) -> None:
-        readme = (baked / "README.md").read_text()
+    def test_readme_ci_section_has_mermaid_flowchart(
+        self, texts: Mapping[str, str]
+    ) -> None:
+        readme = texts["README.md"]
         assert "```mermaid" in readme
         assert "flowchart" in readme
 
     def test_readme_mermaid_names_setup_ci_test_and_cog(
-        self, baked: pathlib.Path
+        self, texts: Mapping[str, str]
     ) -> None:
         """Propagation: the two-branch flowchart must name cog (update-readme path)
         and make setup-ci / make test (ci path). Renames in either workflow
         surface as a red test."""
-        readme = (baked / "README.md").read_text()
+        readme = texts["README.md"]
         mermaid = mermaid_block(readme)
         assert "make setup-ci" in mermaid
         assert "make test" in mermaid
@@ -341,8 +377,8 @@ class TestBakeWithoutWorkflow:
     """Tests specific to include_github_workflows='no'."""
 
     @pytest.fixture(scope="class")
-    def baked(self, tmp_path_factory: pytest.TempPathFactory) -> pathlib.Path:
-        return _bake(tmp_path_factory.mktemp("no-workflow"), workflow="no")
+    def baked(self, bake_for: Callable[[str], pathlib.Path]) -> pathlib.Path:
+        return bake_for("no")
 
     def test_no_github_directory(self, baked: pathlib.Path) -> None:
         assert not (baked / ".github").exists()
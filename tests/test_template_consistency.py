@@ -10,6 +10,8 @@ import pathlib
 import re
 import shutil
 import subprocess
+import tomllib
+from typing import Any
 
 import pytest
 
@@ -42,52 +44,52 @@ def _discover_cookbook_templates() -> list[str]:
 COOKBOOK_TEMPLATES = _discover_cookbook_templates()
 
 
-def _extract_section(text: str, header: str) -> str:
-    """Extract a TOML section by header, returning lines until next section."""
-    lines = text.splitlines()
-    collecting = False
-    result: list[str] = []
-    for line in lines:
-        if line.strip() == header:
-            collecting = True
-            continue
-        if collecting:
-            if line.startswith("[") and not line.startswith("[["):
-                break
-            result.append(line)
-    return "\n".join(result).strip()
-
-
-def _extract_value(text: str, key: str) -> str:
-    """Extract a single key = value from TOML text."""
-    for line in text.splitlines():
-        stripped = line.strip()
-        if stripped.startswith((f"{key} =", f"{key}=")):
-            return stripped.split("=", 1)[1].strip().strip('"')
-    msg = f"Key {key!r} not found"
-    raise KeyError(msg)
+_TEMPLATE_VARIABLE = re.compile(r"\{\{\s*cookiecutter\.(\w+)\s*\}\}")
+
+
+def _load_pyproject(path: pathlib.Path) -> dict[str, Any]:
+    """Parse a template's pyproject.toml with each variable replaced by its name.
+
+    The unrendered file is not valid TOML (repo-cli keys ``[project.scripts]``
+    on ``{{cookiecutter.target_repo}}``), so ``{{cookiecutter.x}}`` becomes
+    ``x`` before parsing.
+    """
+    return tomllib.loads(_TEMPLATE_VARIABLE.sub(r"\1", path.read_text()))
+
+
+@pytest.fixture(scope="module")
+def pyprojects() -> dict[str, dict[str, Any]]:
+    """Both templates' parsed pyproject.toml, keyed by template name."""
+    return {
+        "python-project": _load_pyproject(PP_PYPROJECT),
+        "repo-cli": _load_pyproject(RC_PYPROJECT),
+    }
 
 
 class TestPythonVersionParity:
     """Both templates must target the same Python version."""
 
-    def test_requires_python_matches(self) -> None:
-        pp = _extract_value(PP_PYPROJECT.read_text(), "requires-python")
-        rc = _extract_value(RC_PYPROJECT.read_text(), "requires-python")
+    def test_requires_python_matches(
+        self, pyprojects: dict[str, dict[str, Any]]
+    ) -> None:
+        pp = pyprojects["python-project"]["project"]["requires-python"]
+        rc = pyprojects["repo-cli"]["project"]["requires-python"]
         assert pp == rc, f"python-project: {pp}, repo-cli: {rc}"
 
-    def test_mypy_python_version_matches(self) -> None:
-        pp = _extract_value(PP_PYPROJECT.read_text(), "python_version")
-        rc = _extract_value(RC_PYPROJECT.read_text(), "python_version")
+    def test_mypy_python_version_matches(
+        self, pyprojects: dict[str, dict[str, Any]]
+    ) -> None:
+        pp = pyprojects["python-project"]["tool"]["mypy"]["python_version"]
+        rc = pyprojects["repo-cli"]["tool"]["mypy"]["python_version"]
         assert pp == rc, f"python-project: {pp}, repo-cli: {rc}"
 
 
 class TestMypyStrictSettings:
     """Both templates must use identical strict mypy settings."""
 
-    def test_mypy_settings_match(self) -> None:
-        pp_mypy = _extract_section(PP_PYPROJECT.read_text(), "[tool.mypy]")
-        rc_mypy = _extract_section(RC_PYPROJECT.read_text(), "[tool.mypy]")
+    def test_mypy_settings_match(self, pyprojects: dict[str, dict[str, Any]]) -> None:
+        pp_mypy = pyprojects["python-project"]["tool"]["mypy"]
+        rc_mypy = pyprojects["repo-cli"]["tool"]["mypy"]
         assert pp_mypy == rc_mypy, (
             f"mypy settings differ:\npython-project:\n{pp_mypy}\n\nrepo-cli:\n{rc_mypy}"
         )
@@ -96,30 +98,25 @@ class TestMypyStrictSettings:
 class TestDevDependencyBaseline:
     """Both templates must include the same core dev tool set."""
 
-    def test_shared_dev_dependencies(self) -> None:
+    def test_shared_dev_dependencies(
+        self, pyprojects: dict[str, dict[str, Any]]
+    ) -> None:
         required = {"pytest", "pytest-cov", "pytest-mock", "ruff", "mypy"}
-        for name, path in [
-            ("python-project", PP_PYPROJECT),
-            ("repo-cli", RC_PYPROJECT),
-        ]:
-            text = path.read_text()
-            dev_section = _extract_section(text, "[dependency-groups]")
-            for dep in required:
-                assert f'"{dep}"' in dev_section, (
-                    f"{name} template missing dev dependency: {dep}"
-                )
+        for name, cfg in pyprojects.items():
+            missing = required - set(cfg["dependency-groups"]["dev"])
+            assert not missing, (
+                f"{name} template missing dev dependencies: {sorted(missing)}"
+            )
 
 
 class TestBuildBackendMatch:
     """Both templates must use the same build backend."""
 
-    def test_build_backend_is_hatchling(self) -> None:
-        for name, path in [
-            ("python-project", PP_PYPROJECT),
-            ("repo-cli", RC_PYPROJECT),
-        ]:
-            text = path.read_text()
-            assert 'build-backend = "hatchling.build"' in text, (
+    def test_build_backend_is_hatchling(
+        self, pyprojects: dict[str, dict[str, Any]]
+    ) -> None:
+        for name, cfg in pyprojects.items():
+            assert cfg["build-system"]["build-backend"] == "hatchling.build", (
                 f"{name} template does not use hatchling"
             )
 
@@ -127,21 +124,14 @@ class TestBuildBackendMatch:
 class TestDependencyMatch:
     """Both templates must include the same runtime dependencies."""
 
-    def test_click_in_both(self) -> None:
-        for name, path in [
-            ("python-project", PP_PYPROJECT),
-            ("repo-cli", RC_PYPROJECT),
-        ]:
-            text = path.read_text()
-            assert '"click"' in text, f"{name} missing click dependency"
-
-    def test_pydantic_in_both(self) -> None:
-        for name, path in [
-            ("python-project", PP_PYPROJECT),
-            ("repo-cli", RC_PYPROJECT),
-        ]:
-            text = path.read_text()
-            assert '"pydantic"' in text, f"{name} missing pydantic dependency"
+    @pytest.mark.parametrize("dependency", ["click", "pydantic"])
+    def test_dependency_in_both(
+        self, pyprojects: dict[str, dict[str, Any]], dependency: str
+    ) -> None:
+        for name, cfg in pyprojects.items():
+            assert dependency in cfg["project"]["dependencies"], (
+                f"{name} missing {dependency} dependency"
+            )
 
 
 class TestPerTemplateAgentGuidance:
@@ -208,9 +198,17 @@ class TestPerTemplateAgentGuidance:
             pytest.skip(f"{template} is not a Python template")
         if not (baked / "tests").is_dir():
             pytest.fail(f"{template} declares pyproject.toml but ships no tests/ dir")
-        subprocess.run(["uv", "sync"], cwd=baked, check=True, capture_output=True)
+        sync = subprocess.run(
+            ["uv", "sync"],
+            cwd=baked,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+            check=False,
+        )
+        assert sync.returncode == 0, f"{template}'s uv sync failed:\n{sync.stderr}"
         result = subprocess.run(
-            ["uv", "run", "pytest", "tests/"],
+            ["uv", "run", "--no-sync", "pytest", "tests/"],
             cwd=baked,
             capture_output=True,
             text=True,